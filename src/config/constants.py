@@ -45,10 +45,37 @@ TOPIC_KEYWORDS: Dict[TopicCategory, List[str]] = {
 }
 
 # Flatten all keywords for quick lookup in Gate 2
-ALL_RELEVANT_KEYWORDS = [
+ALL_RELEVANT_KEYWORDS = frozenset(
     keyword for keywords_list in TOPIC_KEYWORDS.values()
     for keyword in keywords_list
-]
+)
+
+# Alias kept for call sites that want the membership-test intent explicit
+ALL_RELEVANT_KEYWORDS_SET = ALL_RELEVANT_KEYWORDS
+
+# Reverse lookup: keyword -> topic category, so Gate 2 can report which
+# category matched without a second scan. Keywords listed under several
+# categories resolve to the last one in TOPIC_KEYWORDS order.
+KEYWORD_TO_CATEGORY: Dict[str, TopicCategory] = {
+    keyword: category
+    for category, keywords_list in TOPIC_KEYWORDS.items()
+    for keyword in keywords_list
+}
+
+# Aho-Corasick automaton for single-pass keyword scanning (built once at import).
+# Each hit yields (keyword, category) so relevance counting and topic
+# classification happen in the same traversal. Falls back to None when
+# pyahocorasick is not installed; consumers must handle the fallback with a
+# plain substring scan.
+try:
+    import ahocorasick
+
+    KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _keyword, _category in KEYWORD_TO_CATEGORY.items():
+        KEYWORD_AUTOMATON.add_word(_keyword, (_keyword, _category))
+    KEYWORD_AUTOMATON.make_automaton()
+except ImportError:
+    KEYWORD_AUTOMATON = None
 
 MIN_KEYWORD_MATCHES = 2  # Minimum keyword matches for relevance gate
 
@@ -62,20 +89,20 @@ RANKING_SCORE_MAP = {
 }
 
 # Market Indicators Configuration
-CRITICAL_INDICATORS = [
+CRITICAL_INDICATORS = frozenset({
     "petroleo_brent",  # Brent oil (critical for Colombia's exports)
     "dxy",             # Dollar Index
     "usd_cop"          # USD/COP exchange rate
-]
+})
 
-IMPORTANT_INDICATORS = [
+IMPORTANT_INDICATORS = frozenset({
     "vix",             # Volatility Index
     "treasury_2y",     # 2-year Treasury yield
     "treasury_10y",    # 10-year Treasury yield
     "sp500"            # S&P 500
-]
+})
 
-CONTEXT_INDICATORS = [
+CONTEXT_INDICATORS = frozenset({
     "petroleo_wti",    # WTI oil
     "gold",            # Gold price
     "coffee",          # Coffee price (Colombian export)
@@ -83,11 +110,13 @@ CONTEXT_INDICATORS = [
     "usd_brl",         # Brazilian Real (regional context)
     "usd_clp",         # Chilean Peso (regional context)
     "eur_usd"          # EUR/USD
-]
+})
 
 # LLM Configuration
 ANTHROPIC_MODEL = "claude-sonnet-4-5-20250929"
+ANTHROPIC_CHEAP_MODEL = "claude-3-5-haiku-20241022"  # Tier for low-signal days
 MAX_TOKENS_PER_STEP = 2000  # Maximum output tokens per processing step
+MAX_STEP1_INPUT_TOKENS = 4000  # Input budget for article content in Step 1
 TEMPERATURE = 0.3  # Lower temperature for more consistent outputs
 
 # Cost Tracking (prices per 1M tokens)
@@ -95,7 +124,10 @@ ANTHROPIC_INPUT_COST_PER_1M = 3.0   # $3 per 1M input tokens
 ANTHROPIC_OUTPUT_COST_PER_1M = 15.0  # $15 per 1M output tokens
 
 # Storage Configuration
-PARQUET_COMPRESSION = "snappy"  # Compression for Parquet files
+# zstd level 3 writes about as fast as snappy on these string-heavy rows
+# but produces noticeably smaller files, so downstream reads move fewer bytes
+PARQUET_COMPRESSION = "zstd"  # Compression for Parquet files
+PARQUET_COMPRESSION_LEVEL = 3
 DATE_PARTITION_FORMAT = "date=%Y-%m-%d"  # Hive-style partitioning
 
 # Pipeline Configuration
@@ -106,11 +138,12 @@ RETRY_DELAY_SECONDS = 5  # Delay between retries
 
 # Duplication Detection
 SIMILARITY_THRESHOLD = 0.9  # Threshold for fuzzy title matching (0-1)
+MAX_SIMHASH_HAMMING = 6  # Max differing bits of 64 to treat titles as duplicates (~0.9 similarity)
 
 # Common Spanish stopwords for deduplication
-SPANISH_STOPWORDS = {
+SPANISH_STOPWORDS = frozenset({
     "el", "la", "de", "que", "y", "a", "en", "un", "ser", "se", "no", "haber",
     "por", "con", "su", "para", "como", "estar", "tener", "le", "lo", "todo",
     "pero", "más", "hacer", "o", "poder", "decir", "este", "ir", "otro", "ese",
     "si", "me", "ya", "ver", "porque", "dar", "cuando", "él", "muy", "sin", "vez"
-}
+})
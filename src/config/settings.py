@@ -1,5 +1,7 @@
 """Settings configuration using Pydantic."""
 
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -17,6 +19,9 @@ class Settings(BaseSettings):
 
     # API Keys
     anthropic_api_key: str
+    # Optional comma-separated key pool; batch runs spread requests
+    # across keys so no single rate limit serializes the chain
+    anthropic_api_keys: Optional[str] = None
     openai_api_key: Optional[str] = None  # Optional, not used currently
     google_api_key: Optional[str] = None  # Optional, not used currently
 
@@ -32,6 +37,7 @@ class Settings(BaseSettings):
     processed_data_dir: Path = data_dir / "processed"
     aggregated_data_dir: Path = data_dir / "aggregated"
     gates_data_dir: Path = data_dir / "gates"
+    cache_dir: Path = data_dir / "cache"
 
     # Logging
     log_level: str = "INFO"
@@ -51,11 +57,6 @@ class Settings(BaseSettings):
     mock_llm: bool = False  # Set to True to use mock LLM for testing
     test_mode: bool = False  # Set to True to run in test mode
 
-    def __init__(self, **kwargs):
-        """Initialize settings and create data directories."""
-        super().__init__(**kwargs)
-        self._create_directories()
-
     def _create_directories(self):
         """Create necessary data directories if they don't exist."""
         for directory in [
@@ -66,10 +67,83 @@ class Settings(BaseSettings):
             self.processed_data_dir,
             self.processed_data_dir / "news",
             self.aggregated_data_dir,
-            self.gates_data_dir
+            self.gates_data_dir,
+            self.cache_dir
         ]:
             directory.mkdir(parents=True, exist_ok=True)
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the application settings singleton.
+
+    Settings are built (and data directories created) on first access
+    instead of at import time, so tools that import the package without
+    touching storage pay no startup cost.
+
+    Returns:
+        Settings instance
+    """
+    instance = Settings()
+    instance._create_directories()
+    return instance
+
+
+# ----------------------------------------------------------------------------
+# Runtime-hot accessors
+#
+# Hot code paths that only need a single value can use these instead of the
+# full Settings object: one environment read, cached, no Pydantic descriptor
+# overhead and no .env parsing.
+# ----------------------------------------------------------------------------
+
+@lru_cache(maxsize=1)
+def anthropic_api_key() -> str:
+    """Get the Anthropic API key from the environment (cached)."""
+    key = os.environ.get("ANTHROPIC_API_KEY")
+    if key is None:
+        return get_settings().anthropic_api_key
+    return key
+
+
+@lru_cache(maxsize=1)
+def anthropic_api_keys() -> Optional[str]:
+    """Get the optional comma-separated API key pool (cached)."""
+    value = os.environ.get("ANTHROPIC_API_KEYS")
+    if value is None:
+        return get_settings().anthropic_api_keys
+    return value
+
+
+@lru_cache(maxsize=1)
+def mock_llm() -> bool:
+    """Check whether the mock LLM is enabled (cached)."""
+    value = os.environ.get("MOCK_LLM")
+    if value is None:
+        return get_settings().mock_llm
+    return value.strip().lower() in ("1", "true", "yes")
+
+
+@lru_cache(maxsize=1)
+def log_level() -> str:
+    """Get the configured log level (cached)."""
+    value = os.environ.get("LOG_LEVEL")
+    if value is None:
+        return get_settings().log_level
+    return value
+
+
+@lru_cache(maxsize=1)
+def log_format() -> str:
+    """Get the configured log format (cached)."""
+    value = os.environ.get("LOG_FORMAT")
+    if value is None:
+        return get_settings().log_format
+    return value
+
+
+def __getattr__(name: str):
+    """Keep `from src.config.settings import settings` working lazily."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,7 @@
 """Base gate interface and pipeline for content validation."""
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Protocol
 import logging
 
@@ -33,6 +34,14 @@ class Gate(Protocol):
 class BaseGate(ABC):
     """Abstract base class for all gates."""
 
+    # No per-instance __dict__: gates are stateless apart from the logger,
+    # and thousands of result objects are created per run
+    __slots__ = ('logger',)
+
+    #: Relative cost of running this gate; GatePipeline sorts by it so the
+    #: cheapest checks run first under fail-fast. Subclasses override.
+    cost_hint: int = 5
+
     def __init__(self):
         """Initialize gate."""
         self.logger = logger
@@ -59,14 +68,19 @@ class BaseGate(ABC):
         self,
         article: RawNews,
         passed: bool,
-        reason: str
+        reason_code: str,
+        reason_params: dict = None
     ) -> GateCheckResult:
         """Create a GateCheckResult.
 
+        The reason is stored as a code plus parameters; the human-readable
+        string is only rendered when the result is logged or persisted.
+
         Args:
             article: Article being checked
             passed: Whether check passed
-            reason: Reason for result
+            reason_code: Key into GATE_REASON_TEMPLATES
+            reason_params: Values interpolated into the template
 
         Returns:
             GateCheckResult object
@@ -75,16 +89,17 @@ class BaseGate(ABC):
             article_id=article.article_id,
             gate_name=self.name,
             gate_result=GateResult.PASS if passed else GateResult.FAIL,
-            gate_reason=reason
+            reason_code=reason_code,
+            reason_params=reason_params
         )
 
     def log_info(self, message: str):
         """Log info message."""
-        self.logger.info(f"[{self.name}] {message}")
+        self.logger.info("[%s] %s", self.name, message)
 
     def log_warning(self, message: str):
         """Log warning message."""
-        self.logger.warning(f"[{self.name}] {message}")
+        self.logger.warning("[%s] %s", self.name, message)
 
 
 class GatePipeline:
@@ -93,10 +108,13 @@ class GatePipeline:
     def __init__(self, gates: List[BaseGate]):
         """Initialize gate pipeline.
 
+        Gates are stably sorted by `cost_hint` so fail-fast runs the
+        cheapest checks first; gates with equal cost keep caller order.
+
         Args:
             gates: List of gates to run
         """
-        self.gates = gates
+        self.gates = sorted(gates, key=lambda gate: gate.cost_hint)
         self.logger = logger
 
     def run(self, article: RawNews) -> tuple[bool, List[GateCheckResult]]:
@@ -110,26 +128,54 @@ class GatePipeline:
         Returns:
             Tuple of (all_passed, list_of_results)
         """
-        results = []
+        # Pre-size the result list to avoid append-driven reallocation
+        results = [None] * len(self.gates)
 
-        for gate in self.gates:
+        for i, gate in enumerate(self.gates):
             result = gate.check(article)
-            results.append(result)
+            results[i] = result
 
             if not result.passed:
                 # Fail fast - stop at first failure
                 self.logger.info(
                     f"Article {article.article_id} failed gate '{gate.name}': {result.gate_reason}"
                 )
-                return False, results
+                return False, results[:i + 1]
 
         # All gates passed
-        self.logger.info(f"Article {article.article_id} passed all {len(self.gates)} gates")
+        self.logger.info("Article %s passed all %d gates", article.article_id, len(self.gates))
         return True, results
 
+    def run_batch(
+        self,
+        articles: List[RawNews],
+        max_workers: int = 8
+    ) -> List[tuple[bool, List[GateCheckResult]]]:
+        """Run the gate pipeline over a batch of articles in parallel.
+
+        Gates must be pure/reentrant: they are invoked concurrently from
+        worker threads. I/O-bound gates (e.g. duplicate detection) overlap,
+        and C-level scans release the GIL.
+
+        Args:
+            articles: Articles to check
+            max_workers: Maximum worker threads
+
+        Returns:
+            List of (all_passed, list_of_results), in input order
+        """
+        if not articles:
+            return []
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.run, articles))
+
     def run_all_gates(self, article: RawNews) -> tuple[bool, List[GateCheckResult]]:
         """Run all gates without fail-fast (for logging purposes).
 
+        Without fail-fast every gate runs anyway, so this keeps the
+        cost-sorted order; result rows carry gate_name for reporting.
+
         Args:
             article: Article to check
 
@@ -3,20 +3,31 @@
 from src.gates.base import BaseGate
 from src.models.schemas import RawNews, GateCheckResult
 from src.storage.local_parquet import ParquetStorage
-from src.config.constants import SIMILARITY_THRESHOLD
+from src.utils.hash_utils import hamming_distance
+from src.config.constants import SIMILARITY_THRESHOLD, MAX_SIMHASH_HAMMING
 
 
 class DuplicateDetectionGate(BaseGate):
     """Gate to detect duplicate articles."""
 
-    def __init__(self, storage: ParquetStorage):
+    __slots__ = ('storage', 'hash_index', '_simhash_index')
+
+    cost_hint = 10  # Storage I/O for hash/title lookups
+
+    def __init__(self, storage: ParquetStorage, hash_index: frozenset = None):
         """Initialize duplicate detection gate.
 
         Args:
             storage: ParquetStorage instance for checking existing articles
+            hash_index: Optional pre-loaded frozenset of stored content
+                hashes; loaded from storage on first check when omitted,
+                so hash checks are always O(1) membership tests instead
+                of per-article storage reads
         """
         super().__init__()
         self.storage = storage
+        self.hash_index = hash_index
+        self._simhash_index = None
 
     @property
     def name(self) -> str:
@@ -35,30 +46,52 @@ class DuplicateDetectionGate(BaseGate):
         Returns:
             GateCheckResult
         """
-        # Check 1: Exact content hash match
-        if self.storage.hash_exists(article.hash_content):
+        # Check 1: Exact content hash match. The index is materialized
+        # once (injected or lazily loaded from storage, like the SimHash
+        # index below), so every check is an O(1) membership test
+        if self.hash_index is None:
+            self.hash_index = self.storage.load_hash_index()
+
+        if article.hash_content in self.hash_index:
             return self._create_result(
                 article=article,
                 passed=False,
-                reason=f"Duplicate content hash: {article.hash_content[:8]}..."
+                reason_code="duplicate_hash",
+                reason_params={"hash_prefix": article.hash_content[:8]}
             )
 
-        # Check 2: Similar title
-        similar_titles = self.storage.find_similar_titles(
-            article.title,
-            threshold=SIMILARITY_THRESHOLD
-        )
+        # Check 2: Similar title via SimHash bucket lookup, falling back to
+        # the full fuzzy scan for articles without a signature
+        if article.title_simhash:
+            if self._simhash_index is None:
+                self._simhash_index = self.storage.load_simhash_index()
 
-        if similar_titles:
-            return self._create_result(
-                article=article,
-                passed=False,
-                reason=f"Similar title found: '{similar_titles[0]}'"
+            band = article.title_simhash >> 48
+            for stored_hash, stored_title in self._simhash_index.get(band, []):
+                if hamming_distance(article.title_simhash, stored_hash) <= MAX_SIMHASH_HAMMING:
+                    return self._create_result(
+                        article=article,
+                        passed=False,
+                        reason_code="duplicate_title",
+                        reason_params={"title": stored_title}
+                    )
+        else:
+            similar_titles = self.storage.find_similar_titles(
+                article.title,
+                threshold=SIMILARITY_THRESHOLD
             )
 
+            if similar_titles:
+                return self._create_result(
+                    article=article,
+                    passed=False,
+                    reason_code="duplicate_title",
+                    reason_params={"title": similar_titles[0]}
+                )
+
         # No duplicates found
         return self._create_result(
             article=article,
             passed=True,
-            reason="No duplicates detected"
+            reason_code="no_duplicates"
         )
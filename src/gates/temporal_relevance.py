@@ -10,6 +10,10 @@ from src.config.constants import MAX_ARTICLE_AGE_HOURS
 class TemporalRelevanceGate(BaseGate):
     """Gate to check if article is recent enough."""
 
+    __slots__ = ()
+
+    cost_hint = 1  # Constant-time date math
+
     @property
     def name(self) -> str:
         return "temporal_relevance"
@@ -43,12 +47,18 @@ class TemporalRelevanceGate(BaseGate):
             return self._create_result(
                 article=article,
                 passed=False,
-                reason=f"Article too old: {age_hours:.1f} hours (max: {MAX_ARTICLE_AGE_HOURS}, source: {date_source})"
+                reason_code="article_too_old",
+                reason_params={
+                    "age_hours": age_hours,
+                    "max_hours": MAX_ARTICLE_AGE_HOURS,
+                    "source": date_source
+                }
             )
 
         # Recent enough
         return self._create_result(
             article=article,
             passed=True,
-            reason=f"Article is recent: {age_hours:.1f} hours old (source: {date_source})"
+            reason_code="article_recent",
+            reason_params={"age_hours": age_hours, "source": date_source}
         )
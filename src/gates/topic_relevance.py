@@ -1,38 +1,93 @@
 """Topic relevance gate check."""
 
+from collections import Counter
+from typing import Optional
+
 from src.gates.base import BaseGate
 from src.models.schemas import RawNews, GateCheckResult
+from src.models.enums import TopicCategory
 from src.config.constants import (
     ALL_RELEVANT_KEYWORDS,
+    KEYWORD_AUTOMATON,
+    KEYWORD_TO_CATEGORY,
     MIN_KEYWORD_MATCHES
 )
 
+# In the substring fallback, stop scanning once we have enough matches to
+# pass the gate plus a margin so the reported sample stays representative
+_FALLBACK_MATCH_LIMIT = MIN_KEYWORD_MATCHES + 5
+
 
 class TopicRelevanceGate(BaseGate):
     """Gate to check if article topic is relevant for USD/COP analysis."""
 
+    __slots__ = ()
+
+    cost_hint = 3  # Single C-level keyword scan
+
     @property
     def name(self) -> str:
         return "topic_relevance"
 
-    def _count_keyword_matches(self, text: str) -> tuple[int, list[str]]:
+    def _count_keyword_matches(self, text_lower: str) -> tuple[int, list[str]]:
         """Count how many relevant keywords are in the text.
 
+        Uses an Aho-Corasick automaton for a single linear scan when
+        pyahocorasick is available, falling back to per-keyword substring
+        checks otherwise.
+
         Args:
-            text: Text to check
+            text_lower: Already-lowercased text to check
 
         Returns:
             Tuple of (count, list_of_matched_keywords)
         """
-        text_lower = text.lower()
-        matched_keywords = []
+        if KEYWORD_AUTOMATON is not None:
+            matched = {keyword for _, (keyword, _category) in KEYWORD_AUTOMATON.iter(text_lower)}
+            return len(matched), list(matched)
 
+        # Fallback substring scan; the automaton path keeps the full scan
+        # because its matches also feed topic classification
+        matched_keywords = []
         for keyword in ALL_RELEVANT_KEYWORDS:
             if keyword in text_lower:
                 matched_keywords.append(keyword)
+                if len(matched_keywords) >= _FALLBACK_MATCH_LIMIT:
+                    break
 
         return len(matched_keywords), matched_keywords
 
+    @staticmethod
+    def category_counts(matched_keywords: list[str]) -> Counter:
+        """Aggregate matched keywords into per-category counts.
+
+        Args:
+            matched_keywords: Keywords found in the article
+
+        Returns:
+            Counter mapping TopicCategory to match count
+        """
+        return Counter(KEYWORD_TO_CATEGORY[kw] for kw in matched_keywords)
+
+    @staticmethod
+    def dominant_category(cat_counts: Counter) -> Optional[TopicCategory]:
+        """Get the category that clearly dominates the keyword evidence.
+
+        Args:
+            cat_counts: Per-category match counts
+
+        Returns:
+            Dominant TopicCategory, or None if no category has a clear margin
+        """
+        total = sum(cat_counts.values())
+        if total < 5:
+            return None
+
+        category, count = cat_counts.most_common(1)[0]
+        if count / total > 0.7:
+            return category
+        return None
+
     def check(self, article: RawNews) -> GateCheckResult:
         """Check if article is topically relevant.
 
@@ -45,8 +100,8 @@ class TopicRelevanceGate(BaseGate):
         Returns:
             GateCheckResult
         """
-        # Combine title and content for checking
-        full_text = f"{article.title} {article.content}"
+        # Combine cached lowercase title and content for checking
+        full_text = f"{article.title_lower} {article.content_lower}"
 
         # Count keyword matches
         match_count, matched_keywords = self._count_keyword_matches(full_text)
@@ -55,13 +110,33 @@ class TopicRelevanceGate(BaseGate):
             return self._create_result(
                 article=article,
                 passed=False,
-                reason=f"Insufficient keyword matches: {match_count} < {MIN_KEYWORD_MATCHES}"
+                reason_code="keywords_insufficient",
+                reason_params={"count": match_count, "required": MIN_KEYWORD_MATCHES}
             )
 
         # Passed - article is topically relevant
-        keywords_sample = matched_keywords[:5]  # Show first 5
+        keywords_sample = ', '.join(matched_keywords[:5])  # Show first 5
+
+        # Report the dominant category so downstream steps can reuse the
+        # keyword evidence instead of re-deriving it
+        cat_counts = self.category_counts(matched_keywords)
+        dominant = self.dominant_category(cat_counts)
+
+        if dominant is not None:
+            return self._create_result(
+                article=article,
+                passed=True,
+                reason_code="keywords_ok_dominant",
+                reason_params={
+                    "count": match_count,
+                    "sample": keywords_sample,
+                    "dominant": dominant.value
+                }
+            )
+
         return self._create_result(
             article=article,
             passed=True,
-            reason=f"Found {match_count} relevant keywords (e.g., {', '.join(keywords_sample)})"
+            reason_code="keywords_ok",
+            reason_params={"count": match_count, "sample": keywords_sample}
         )
@@ -1,17 +1,18 @@
-"""LLM prompts for 4-step chain processing with Chain of Thought (COT)."""
+"""LLM prompts for 4-step chain processing with Chain of Thought (COT).
+
+Each step is split into a STATIC part (role, framework, examples, output
+spec — identical across articles) and a DYNAMIC part (the article data).
+The static part always leads and the dynamic part trails so the static
+prefix can be served from Anthropic's prompt cache across calls.
+"""
 
 # ============================================================================
 # STEP 1: SUMMARIZATION
 # ============================================================================
 
-STEP_1_SUMMARIZATION = """Eres un analista económico experto en Colombia con profundo conocimiento del mercado de divisas y la economía colombiana.
-
-Tu tarea es analizar este artículo de noticias colombiano de manera sistemática.
+STEP_1_SUMMARIZATION_STATIC = """Eres un analista económico experto en Colombia con profundo conocimiento del mercado de divisas y la economía colombiana.
 
-<article>
-<title>{title}</title>
-<content>{content}</content>
-</article>
+Tu tarea es analizar de manera sistemática el artículo de noticias colombiano incluido al final.
 
 Piensa en voz alta siguiendo estos pasos:
 
@@ -26,27 +27,24 @@ Piensa en voz alta siguiendo estos pasos:
 5. **Síntesis**: Ahora que has analizado los componentes, resume la esencia económica de la noticia en 3-4 oraciones concisas.
 
 Responde ÚNICAMENTE en JSON con este formato exacto:
-{{
+{
   "reasoning": "Tu análisis detallado paso a paso de los 4 puntos anteriores",
   "summary": "Resumen conciso en 3-4 oraciones que capture la esencia económica"
-}}"""
+}"""
+
+STEP_1_SUMMARIZATION_DYNAMIC = """<article>
+<title>{title}</title>
+<content>{content}</content>
+</article>"""
 
 
 # ============================================================================
 # STEP 2: TOPIC EXTRACTION
 # ============================================================================
 
-STEP_2_TOPIC_EXTRACTION = """Eres un experto en clasificación de noticias económicas colombianas con profundo conocimiento de los factores que afectan el tipo de cambio USD/COP.
+STEP_2_TOPIC_EXTRACTION_STATIC = """Eres un experto en clasificación de noticias económicas colombianas con profundo conocimiento de los factores que afectan el tipo de cambio USD/COP.
 
-<summary>
-{summary}
-</summary>
-
-<title>
-{title}
-</title>
-
-Identifica los temas relevantes siguiendo estos pasos de análisis:
+Analizarás el resumen y título incluidos al final. Identifica los temas relevantes siguiendo estos pasos de análisis:
 
 1. **Sectores económicos**: ¿Qué sectores se mencionan?
    - Petróleo y gas (critical para Colombia - 40% de exportaciones)
@@ -98,36 +96,31 @@ Ahora, basado en tu análisis, clasifica la noticia en UNA O MÁS de estas categ
 - "other": Temas que no encajan claramente en las categorías anteriores
 
 Responde ÚNICAMENTE en JSON con este formato exacto:
-{{
+{
   "reasoning": "Tu análisis detallado paso a paso considerando los 6 aspectos",
   "topics": ["topic1", "topic2"],
   "confidence": 0.95
-}}
+}
 
 IMPORTANTE: topics debe ser una lista de strings con las categorías exactas listadas arriba.
 confidence debe ser un número entre 0.0 y 1.0 indicando tu confianza en la clasificación."""
 
+STEP_2_TOPIC_EXTRACTION_DYNAMIC = """<summary>
+{summary}
+</summary>
+
+<title>
+{title}
+</title>"""
+
 
 # ============================================================================
 # STEP 3: IMPACT ANALYSIS
 # ============================================================================
 
-STEP_3_IMPACT_ANALYSIS = """Eres un trader senior de divisas especializado en el peso colombiano (COP) con 15 años de experiencia analizando el mercado USD/COP.
-
-Tu objetivo es evaluar el impacto de esta noticia en el tipo de cambio USD/COP.
+STEP_3_IMPACT_ANALYSIS_STATIC = """Eres un trader senior de divisas especializado en el peso colombiano (COP) con 15 años de experiencia analizando el mercado USD/COP.
 
-<news_summary>
-{summary}
-</news_summary>
-
-<topics>
-{topics}
-</topics>
-
-<market_context>
-Contexto del mercado actual:
-{market_context}
-</market_context>
+Tu objetivo es evaluar el impacto en el tipo de cambio USD/COP de la noticia incluida al final, junto con su contexto de mercado.
 
 Analiza el impacto en el tipo de cambio USD/COP siguiendo este framework sistemático:
 
@@ -166,33 +159,40 @@ Analiza el impacto en el tipo de cambio USD/COP siguiendo este framework sistem
    - long-term: Impacto estructural en meses a años
 
 Responde ÚNICAMENTE en JSON con este formato exacto:
-{{
+{
   "reasoning": "Tu análisis detallado paso a paso de los 6 puntos anteriores",
   "direction": "POSITIVE o NEGATIVE o NEUTRAL",
   "mechanisms": ["mecanismo1", "mecanismo2", "mecanismo3"],
   "confidence": 0.85,
   "time_horizon": "short-term o medium-term o long-term"
-}}
+}
 
 IMPORTANTE:
 - mechanisms debe listar 2-4 mecanismos específicos por los cuales la noticia afecta el USD/COP
 - confidence debe ser 0.0 a 1.0
-- direction debe ser exactamente "POSITIVE", "NEGATIVE", o "NEUTRAL"""
+- direction debe ser exactamente "POSITIVE", "NEGATIVE", o "NEUTRAL\""""
+
+STEP_3_IMPACT_ANALYSIS_DYNAMIC = """<news_summary>
+{summary}
+</news_summary>
+
+<topics>
+{topics}
+</topics>
+
+<market_context>
+Contexto del mercado actual:
+{market_context}
+</market_context>"""
 
 
 # ============================================================================
 # STEP 4: RANKING
 # ============================================================================
 
-STEP_4_RANKING = """Eres el jefe de mesa de operaciones de un fondo de inversión que opera el par USD/COP.
-
-Tu trabajo es filtrar noticias y asignar prioridades para tu equipo de traders. Debes ser selectivo y realista.
+STEP_4_RANKING_STATIC = """Eres el jefe de mesa de operaciones de un fondo de inversión que opera el par USD/COP.
 
-<news_data>
-<summary>{summary}</summary>
-<topics>{topics}</topics>
-<impact_analysis>{impact}</impact_analysis>
-</news_data>
+Tu trabajo es filtrar noticias y asignar prioridades para tu equipo de traders. Debes ser selectivo y realista. La noticia a evaluar está incluida al final.
 
 Evalúa la relevancia de esta noticia para un trader de USD/COP siguiendo este framework de decisión:
 
@@ -261,41 +261,217 @@ Score 4 (High): Reformas fiscales importantes, grandes proyectos de Ecopetrol, c
 Score 5 (Critical): Shock petrolero (cambio >5% en Brent), crisis política grave, intervención del Banco de la República, cambio de calificación crediticia del país, desastres naturales mayores, acuerdos comerciales transformadores
 
 Responde ÚNICAMENTE en JSON con este formato exacto:
-{{
+{
   "reasoning": "Tu análisis paso a paso de los 4 criterios y el cálculo de puntos",
   "score": 3,
   "category": "Moderate",
   "justification": "1-2 oraciones explicando por qué asignaste este score",
   "trader_action": "monitor o alert o urgent"
-}}
+}
 
 CRÍTICO: Sé selectivo y realista. La mayoría de noticias deben ser score 1-3. Solo noticias verdaderamente importantes merecen 4-5."""
 
+STEP_4_RANKING_DYNAMIC = """<news_data>
+<summary>{summary}</summary>
+<topics>{topics}</topics>
+<impact_analysis>{impact}</impact_analysis>
+</news_data>"""
+
+
+# ============================================================================
+# FUSED STEPS 2+3: TOPICS + IMPACT IN ONE CALL
+# ============================================================================
+
+STEP_2_3_FUSED_STATIC = """Eres un analista económico senior especializado en el mercado USD/COP, experto tanto en clasificación de noticias económicas colombianas como en análisis de impacto cambiario.
+
+Vas a analizar el resumen de noticia incluido al final ejecutando dos pasos en una sola pasada:
+
+1. **Temas**: Clasifica la noticia en una o más de estas categorías exactas:
+   - "economy": Indicadores macroeconómicos, comercio, inversión, PIB, empleo
+   - "politics": Gobierno, reformas, elecciones, legislación
+   - "security": Conflicto armado, criminalidad, orden público
+   - "energy": Petróleo, gas, Ecopetrol, precios de crudo, producción
+   - "international": Relaciones exteriores, tratados, comercio internacional
+   - "monetary": Banco de la República, tasas, política monetaria, tipo de cambio
+   - "other": Temas que no encajan claramente en las categorías anteriores
+
+2. **Impacto en USD/COP**: Determina dirección ("POSITIVE" fortalece el peso, "NEGATIVE" lo debilita, "NEUTRAL" sin impacto claro), 2-4 mecanismos específicos, y horizonte temporal ("short-term", "medium-term" o "long-term"). Considera exportaciones (petróleo ~40%), inversión extranjera, estabilidad fiscal y posible reacción del Banco de la República, usando el contexto de mercado incluido.
+
+Responde ÚNICAMENTE en JSON con este formato exacto:
+{
+  "topics": ["topic1", "topic2"],
+  "topics_reasoning": "Tu razonamiento de la clasificación",
+  "topics_confidence": 0.9,
+  "direction": "POSITIVE o NEGATIVE o NEUTRAL",
+  "mechanisms": ["mecanismo1", "mecanismo2"],
+  "impact_confidence": 0.85,
+  "time_horizon": "short-term o medium-term o long-term",
+  "impact_reasoning": "Tu razonamiento del impacto"
+}
+
+IMPORTANTE: topics debe ser una lista de strings con las categorías exactas listadas arriba; confidence debe ser un número entre 0.0 y 1.0."""
+
+STEP_2_3_FUSED_DYNAMIC = """<summary>
+{summary}
+</summary>
+
+<title>
+{title}
+</title>
+
+<market_context>
+Contexto del mercado actual:
+{market_context}
+</market_context>"""
+
+
+# ============================================================================
+# FUSED: ALL 4 STEPS FOR ONE ARTICLE IN ONE CALL
+# ============================================================================
+
+STEP_FUSED_STATIC = """Eres un analista económico senior especializado en el mercado USD/COP, con experiencia en resumen de noticias, clasificación temática, análisis de impacto cambiario y priorización para traders.
+
+Vas a analizar el artículo incluido al final ejecutando los 4 pasos del análisis completo en una sola pasada:
+
+1. **Resumen**: Resume la esencia económica en 3-4 oraciones (actores, eventos, declaraciones, contexto económico).
+
+2. **Temas**: Clasifica en una o más categorías exactas:
+   "economy", "politics", "security", "energy", "international", "monetary", "other"
+
+3. **Impacto en USD/COP**: Determina dirección ("POSITIVE" fortalece el peso, "NEGATIVE" lo debilita, "NEUTRAL" sin impacto claro), 2-4 mecanismos específicos, y horizonte temporal ("short-term", "medium-term" o "long-term"). Considera exportaciones (petróleo ~40%), inversión extranjera, estabilidad fiscal y posible reacción del Banco de la República.
+
+4. **Ranking**: Score 1-5 según relevancia para un trader de USD/COP (1=Irrelevant, 2=Low, 3=Moderate, 4=High, 5=Critical) con categoría ("Irrelevant", "Low", "Moderate", "High", "Critical"), justificación de 1-2 oraciones y trader_action ("monitor" para score 1-2, "alert" para 3-4, "urgent" para 5). Sé selectivo: la mayoría de noticias merecen score 1-3.
+
+Responde ÚNICAMENTE en JSON con este formato exacto:
+{
+  "summary": "Resumen conciso en 3-4 oraciones",
+  "summary_reasoning": "Tu razonamiento del resumen",
+  "topics": ["topic1", "topic2"],
+  "topics_reasoning": "Tu razonamiento de la clasificación",
+  "topics_confidence": 0.9,
+  "direction": "POSITIVE o NEGATIVE o NEUTRAL",
+  "mechanisms": ["mecanismo1", "mecanismo2"],
+  "impact_confidence": 0.85,
+  "time_horizon": "short-term o medium-term o long-term",
+  "impact_reasoning": "Tu razonamiento del impacto",
+  "score": 3,
+  "category": "Moderate",
+  "justification": "1-2 oraciones explicando el score",
+  "trader_action": "monitor o alert o urgent",
+  "ranking_reasoning": "Tu razonamiento del ranking"
+}"""
+
+STEP_FUSED_DYNAMIC = """<market_context>
+{market_context}
+</market_context>
+
+<article>
+<title>{title}</title>
+<content>{content}</content>
+</article>"""
+
+
+# ============================================================================
+# COMBINED: ALL 4 STEPS FOR A BATCH OF ARTICLES IN ONE CALL
+# ============================================================================
+
+STEP_COMBINED = """Eres un analista económico senior especializado en el mercado USD/COP, con experiencia en resumen de noticias, clasificación temática, análisis de impacto cambiario y priorización para traders.
+
+Vas a analizar un LOTE de artículos de noticias colombianas. Para CADA artículo debes ejecutar los 4 pasos del análisis completo:
+
+1. **Resumen**: Resume la esencia económica en 3-4 oraciones (actores, eventos, declaraciones, contexto económico).
+
+2. **Temas**: Clasifica en una o más categorías exactas:
+   "economy", "politics", "security", "energy", "international", "monetary", "other"
+
+3. **Impacto en USD/COP**: Determina dirección ("POSITIVE" fortalece el peso, "NEGATIVE" lo debilita, "NEUTRAL" sin impacto claro), 2-4 mecanismos específicos, y horizonte temporal ("short-term", "medium-term" o "long-term"). Considera exportaciones (petróleo ~40%), inversión extranjera, estabilidad fiscal y posible reacción del Banco de la República.
+
+4. **Ranking**: Score 1-5 según relevancia para un trader de USD/COP (1=Irrelevant, 2=Low, 3=Moderate, 4=High, 5=Critical) con categoría ("Irrelevant", "Low", "Moderate", "High", "Critical"), justificación de 1-2 oraciones y trader_action ("monitor" para score 1-2, "alert" para 3-4, "urgent" para 5). Sé selectivo: la mayoría de noticias merecen score 1-3.
+
+<market_context>
+{market_context}
+</market_context>
+
+<articles>
+{articles}
+</articles>
+
+Responde ÚNICAMENTE con un array JSON, un objeto por artículo, EN EL MISMO ORDEN de entrada, con este formato exacto:
+[
+  {{
+    "article_id": "id del artículo",
+    "summary": "Resumen conciso en 3-4 oraciones",
+    "topics": ["topic1", "topic2"],
+    "topics_confidence": 0.9,
+    "direction": "POSITIVE o NEGATIVE o NEUTRAL",
+    "mechanisms": ["mecanismo1", "mecanismo2"],
+    "impact_confidence": 0.85,
+    "time_horizon": "short-term o medium-term o long-term",
+    "score": 3,
+    "category": "Moderate",
+    "justification": "1-2 oraciones explicando el score",
+    "trader_action": "monitor o alert o urgent"
+  }}
+]
+
+CRÍTICO: El array debe tener exactamente un objeto por artículo de entrada, con el article_id correspondiente."""
+
+
+def get_combined_prompt(articles, market_context: str) -> str:
+    """Build the combined 4-step prompt for a batch of articles.
+
+    Args:
+        articles: Batch of RawNews articles (10-25 recommended)
+        market_context: Formatted market context string
+
+    Returns:
+        Formatted prompt requesting one JSON array with all outputs
+    """
+    article_blocks = "\n".join(
+        f'<article id="{article.article_id}">\n'
+        f"<title>{article.title}</title>\n"
+        f"<content>{article.content}</content>\n"
+        f"</article>"
+        for article in articles
+    )
+    return STEP_COMBINED.format(
+        market_context=market_context,
+        articles=article_blocks
+    )
+
 
 # ============================================================================
 # Helper function to get prompt by step
 # ============================================================================
 
-def get_prompt_for_step(step: int) -> str:
-    """Get the prompt template for a given processing step.
+# Step-indexed lookup built once at import (index 0 unused so that step
+# numbers map directly to positions)
+_STEP_PROMPTS = (
+    None,
+    (STEP_1_SUMMARIZATION_STATIC, STEP_1_SUMMARIZATION_DYNAMIC),
+    (STEP_2_TOPIC_EXTRACTION_STATIC, STEP_2_TOPIC_EXTRACTION_DYNAMIC),
+    (STEP_3_IMPACT_ANALYSIS_STATIC, STEP_3_IMPACT_ANALYSIS_DYNAMIC),
+    (STEP_4_RANKING_STATIC, STEP_4_RANKING_DYNAMIC)
+)
+
+
+def get_prompt_for_step(step: int) -> tuple[str, str]:
+    """Get the prompt parts for a given processing step.
 
     Args:
         step: Processing step number (1-4)
 
     Returns:
-        Prompt template string
+        Tuple of (static_prefix, dynamic_template). The static prefix is
+        sent unchanged on every call (cacheable); the dynamic template is
+        formatted with the article data and appended after it.
 
     Raises:
         ValueError: If step is not 1-4
     """
-    prompts = {
-        1: STEP_1_SUMMARIZATION,
-        2: STEP_2_TOPIC_EXTRACTION,
-        3: STEP_3_IMPACT_ANALYSIS,
-        4: STEP_4_RANKING
-    }
-
-    if step not in prompts:
+    if step < 1:
         raise ValueError(f"Invalid step number: {step}. Must be 1-4.")
-
-    return prompts[step]
+    try:
+        return _STEP_PROMPTS[step]
+    except IndexError:
+        raise ValueError(f"Invalid step number: {step}. Must be 1-4.") from None
@@ -0,0 +1,171 @@
+"""Flat row representation of ProcessedNews for hot-path serialization.
+
+Pydantic stays at the API boundaries, but Parquet row assembly and audit
+logging only need a flat record of scalars. ProcessedNewsRow carries the
+already-flattened values (enums as strings, lists pre-stringified), so
+building storage records avoids the model_dump + per-key enum scan, and
+encoding a row for logs is a single pass over plain attributes.
+
+Backed by msgspec.Struct when msgspec is installed (2-5x faster encoding,
+slotted memory layout); falls back to a slotted dataclass otherwise.
+"""
+
+import json
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from src.models.schemas import ProcessedNews
+
+# msgspec encodes pure-data records faster than any stdlib path; fall
+# back when absent
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+_ROW_FIELDS = (
+    "article_id", "processing_stage", "chain_step",
+    "input_tokens", "output_tokens", "processing_time_ms", "processed_at",
+    "summary", "summary_cot",
+    "topics", "topics_cot", "topics_confidence",
+    "impact_direction", "impact_mechanisms", "impact_confidence",
+    "impact_time_horizon", "impact_cot",
+    "ranking_score", "ranking_category", "ranking_justification",
+    "ranking_trader_action", "ranking_cot",
+    "date_partition"
+)
+
+
+if msgspec is not None:
+
+    class ProcessedNewsRow(msgspec.Struct, gc=False):
+        """Flat, Parquet-ready view of one processed article."""
+
+        article_id: str
+        processing_stage: str
+        chain_step: int
+        input_tokens: int
+        output_tokens: int
+        processing_time_ms: int
+        processed_at: datetime
+        summary: Optional[str]
+        summary_cot: Optional[str]
+        topics: Optional[str]
+        topics_cot: Optional[str]
+        topics_confidence: Optional[float]
+        impact_direction: Optional[str]
+        impact_mechanisms: Optional[str]
+        impact_confidence: Optional[float]
+        impact_time_horizon: Optional[str]
+        impact_cot: Optional[str]
+        ranking_score: Optional[int]
+        ranking_category: Optional[str]
+        ranking_justification: Optional[str]
+        ranking_trader_action: Optional[str]
+        ranking_cot: Optional[str]
+        date_partition: str
+
+    # Reused encoder + buffer: encode_into rewrites the same bytearray,
+    # so steady-state encoding allocates nothing
+    _encoder = msgspec.json.Encoder()
+    _encode_buffer = bytearray(16 * 1024)
+
+    def encode_row(row: "ProcessedNewsRow") -> bytes:
+        """Encode a row as JSON bytes for audit logging."""
+        _encoder.encode_into(row, _encode_buffer)
+        return bytes(_encode_buffer)
+
+    def row_to_record(row: "ProcessedNewsRow") -> Dict[str, Any]:
+        """Convert a row to a plain dict for DataFrame assembly."""
+        return msgspec.structs.asdict(row)
+
+else:
+
+    from dataclasses import asdict, dataclass
+
+    @dataclass(slots=True)
+    class ProcessedNewsRow:
+        """Flat, Parquet-ready view of one processed article."""
+
+        article_id: str
+        processing_stage: str
+        chain_step: int
+        input_tokens: int
+        output_tokens: int
+        processing_time_ms: int
+        processed_at: datetime
+        summary: Optional[str]
+        summary_cot: Optional[str]
+        topics: Optional[str]
+        topics_cot: Optional[str]
+        topics_confidence: Optional[float]
+        impact_direction: Optional[str]
+        impact_mechanisms: Optional[str]
+        impact_confidence: Optional[float]
+        impact_time_horizon: Optional[str]
+        impact_cot: Optional[str]
+        ranking_score: Optional[int]
+        ranking_category: Optional[str]
+        ranking_justification: Optional[str]
+        ranking_trader_action: Optional[str]
+        ranking_cot: Optional[str]
+        date_partition: str
+
+    def encode_row(row: "ProcessedNewsRow") -> bytes:
+        """Encode a row as JSON bytes for audit logging."""
+        return json.dumps(asdict(row), default=str).encode("utf-8")
+
+    def row_to_record(row: "ProcessedNewsRow") -> Dict[str, Any]:
+        """Convert a row to a plain dict for DataFrame assembly."""
+        return asdict(row)
+
+
+def processed_news_to_row(article: ProcessedNews) -> ProcessedNewsRow:
+    """Flatten a ProcessedNews model into a ProcessedNewsRow.
+
+    Enums become their string values and list columns are stringified
+    once here, matching the Parquet column layout.
+
+    Args:
+        article: Processed article to flatten
+
+    Returns:
+        ProcessedNewsRow with scalar-only fields
+    """
+    return ProcessedNewsRow(
+        article_id=article.article_id,
+        processing_stage=article.processing_stage.value,
+        chain_step=article.chain_step,
+        input_tokens=article.input_tokens,
+        output_tokens=article.output_tokens,
+        processing_time_ms=article.processing_time_ms,
+        processed_at=article.processed_at,
+        summary=article.summary,
+        summary_cot=article.summary_cot,
+        topics=str([t.value for t in article.topics]) if article.topics is not None else None,
+        topics_cot=article.topics_cot,
+        topics_confidence=article.topics_confidence,
+        impact_direction=(
+            article.impact_direction.value if article.impact_direction is not None else None
+        ),
+        impact_mechanisms=(
+            str(article.impact_mechanisms) if article.impact_mechanisms is not None else None
+        ),
+        impact_confidence=article.impact_confidence,
+        impact_time_horizon=(
+            article.impact_time_horizon.value if article.impact_time_horizon is not None else None
+        ),
+        impact_cot=article.impact_cot,
+        ranking_score=article.ranking_score,
+        ranking_category=(
+            article.ranking_category.value if article.ranking_category is not None else None
+        ),
+        ranking_justification=article.ranking_justification,
+        ranking_trader_action=(
+            article.ranking_trader_action.value
+            if article.ranking_trader_action is not None else None
+        ),
+        ranking_cot=article.ranking_cot,
+        date_partition=article.date_partition
+    )
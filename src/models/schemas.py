@@ -1,14 +1,42 @@
 """Pydantic schemas for the news analysis pipeline."""
 
+import sys
 from datetime import datetime
+
+import numpy as np
+from functools import cached_property
 from typing import List, Optional, Dict, Any
 from uuid import uuid4
-from pydantic import BaseModel, Field, field_validator
+from pydantic import (
+    BaseModel, Field, PrivateAttr, TypeAdapter,
+    computed_field, field_validator, model_validator
+)
+from src.config.constants import (
+    ANTHROPIC_INPUT_COST_PER_1M,
+    ANTHROPIC_OUTPUT_COST_PER_1M,
+    SPANISH_STOPWORDS
+)
 from src.models.enums import (
     GateResult, RankingCategory, ProcessingStage,
     ImpactDirection, TimeHorizon, TopicCategory,
     MarketTier, TraderAction
 )
+from src.utils.clock import now_cached
+from src.utils.hash_utils import hash_content_fast, simhash64
+
+
+def _make_id() -> str:
+    """Generate a random 32-char hex id (uuid4 without hyphen formatting)."""
+    return uuid4().hex
+
+
+def _format_date_partition(dt: datetime) -> str:
+    """Format a datetime as YYYY-MM-DD without the strftime engine.
+
+    Direct f-string formatting skips the locale-aware format-string
+    parser and is an order of magnitude faster on this hot path.
+    """
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
 
 
 # ============================================================================
@@ -18,15 +46,39 @@ from src.models.enums import (
 class RawNews(BaseModel):
     """Schema for raw news articles scraped from sources."""
 
-    article_id: str = Field(default_factory=lambda: str(uuid4()))
+    article_id: str = Field(default_factory=_make_id)
     url: str
     title: str
     content: str
-    scraped_at: datetime = Field(default_factory=datetime.now)
+    scraped_at: datetime = Field(default_factory=now_cached)
     source: str = "CNN_Colombia"
     content_length: int = Field(default=0)
     hash_content: str = Field(default="")
-    date_partition: str = Field(default="")
+    title_simhash: int = Field(default=0)
+
+    # Lazily cached lowercase copies, shared across gate checks
+    _content_lower: Optional[str] = PrivateAttr(default=None)
+    _title_lower: Optional[str] = PrivateAttr(default=None)
+
+    @property
+    def content_lower(self) -> str:
+        """Lowercased content, computed once and reused by all gates."""
+        if self._content_lower is None:
+            self._content_lower = self.content.lower()
+        return self._content_lower
+
+    @property
+    def title_lower(self) -> str:
+        """Lowercased title, computed once and reused by all gates."""
+        if self._title_lower is None:
+            self._title_lower = self.title.lower()
+        return self._title_lower
+
+    @field_validator("source", mode="before")
+    @classmethod
+    def intern_source(cls, v):
+        """Intern the source so bulk loads share one string object."""
+        return sys.intern(v) if isinstance(v, str) else v
 
     @field_validator("content_length", mode="before")
     @classmethod
@@ -36,16 +88,27 @@ class RawNews(BaseModel):
             return len(info.data["content"])
         return v
 
-    @field_validator("date_partition", mode="before")
-    @classmethod
-    def compute_date_partition(cls, v, info):
-        """Compute date partition from scraped_at."""
-        if not v and "scraped_at" in info.data:
-            scraped_at = info.data["scraped_at"]
-            if isinstance(scraped_at, str):
-                scraped_at = datetime.fromisoformat(scraped_at)
-            return scraped_at.strftime("%Y-%m-%d")
-        return v
+    @model_validator(mode="after")
+    def compute_dedup_keys(self):
+        """Compute the content hash and title SimHash when unset.
+
+        Guarantees every article carries its dedup keys so the pipeline
+        can short-circuit duplicates before any LLM spend. Runs as a
+        mode="after" model validator because before-mode field
+        validators never fire for defaulted fields, which would leave
+        both keys at their empty defaults.
+        """
+        if not self.hash_content and self.content:
+            self.hash_content = hash_content_fast(self.content)
+        if not self.title_simhash and self.title:
+            self.title_simhash = simhash64(self.title, SPANISH_STOPWORDS)
+        return self
+
+    @computed_field
+    @cached_property
+    def date_partition(self) -> str:
+        """Date partition derived from scraped_at, computed once on access."""
+        return _format_date_partition(self.scraped_at)
 
     model_config = {"frozen": False}
 
@@ -60,30 +123,71 @@ class MarketIndicator(BaseModel):
     change_value: Optional[float] = None
     change_pct: Optional[float] = None
     tier: MarketTier
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = Field(default_factory=now_cached)
     error: Optional[str] = None
 
-    model_config = {"frozen": False}
+    # Indicators never change after scraping; freezing lets pydantic-core
+    # skip the mutable-setattr machinery and makes instances hashable
+    model_config = {"frozen": True}
 
 
 class MarketSnapshot(BaseModel):
     """Schema for a complete market snapshot at a point in time."""
 
-    snapshot_id: str = Field(default_factory=lambda: str(uuid4()))
-    timestamp: datetime = Field(default_factory=datetime.now)
+    snapshot_id: str = Field(default_factory=_make_id)
+    timestamp: datetime = Field(default_factory=now_cached)
     indicators: Dict[str, MarketIndicator] = Field(default_factory=dict)
-    date_partition: str = Field(default="")
 
-    @field_validator("date_partition", mode="before")
-    @classmethod
-    def compute_date_partition(cls, v, info):
-        """Compute date partition from timestamp."""
-        if not v and "timestamp" in info.data:
-            timestamp = info.data["timestamp"]
-            if isinstance(timestamp, str):
-                timestamp = datetime.fromisoformat(timestamp)
-            return timestamp.strftime("%Y-%m-%d")
-        return v
+    # Parallel arrays (structure-of-arrays) extracted once from the
+    # indicator models, so repeated context rendering avoids Pydantic
+    # attribute lookups per indicator
+    _names: Optional[List[str]] = PrivateAttr(default=None)
+    _values: Optional[List[float]] = PrivateAttr(default=None)
+    _change_pcts: Optional[List[Optional[float]]] = PrivateAttr(default=None)
+    _context_string: Optional[str] = PrivateAttr(default=None)
+
+    @computed_field
+    @cached_property
+    def date_partition(self) -> str:
+        """Date partition derived from timestamp, computed once on access."""
+        return _format_date_partition(self.timestamp)
+
+    def _build_columns(self) -> None:
+        """Extract indicator fields into parallel arrays (built lazily once)."""
+        indicators = self.indicators
+        self._names = list(indicators.keys())
+        self._values = [ind.value for ind in indicators.values()]
+        self._change_pcts = [ind.change_pct for ind in indicators.values()]
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """Expose indicator fields as parallel float32 NumPy arrays.
+
+        Struct-of-arrays view for vectorized stats: aggregates over a
+        snapshot operate on contiguous arrays instead of re-iterating
+        Pydantic objects per field. Missing values come back as NaN.
+
+        Returns:
+            Dict with "value", "previous_close", "change_value" and
+            "change_pct" arrays, aligned with self.indicators order
+        """
+        indicators = list(self.indicators.values())
+
+        def _column(field: str) -> np.ndarray:
+            return np.array(
+                [
+                    getattr(ind, field) if getattr(ind, field) is not None
+                    else np.nan
+                    for ind in indicators
+                ],
+                dtype=np.float32
+            )
+
+        return {
+            "value": _column("value"),
+            "previous_close": _column("previous_close"),
+            "change_value": _column("change_value"),
+            "change_pct": _column("change_pct"),
+        }
 
     def get_indicator_value(self, name: str) -> Optional[float]:
         """Get value of an indicator by name."""
@@ -91,12 +195,20 @@ class MarketSnapshot(BaseModel):
         return indicator.value if indicator else None
 
     def to_context_string(self) -> str:
-        """Convert market snapshot to formatted string for LLM context."""
-        lines = []
-        for name, indicator in self.indicators.items():
-            change_str = f"({indicator.change_pct:+.2f}%)" if indicator.change_pct else ""
-            lines.append(f"{name}: {indicator.value:.2f} {change_str}")
-        return "\n".join(lines)
+        """Convert market snapshot to formatted string for LLM context.
+
+        Indicators are fixed once the snapshot is scraped, so the rendered
+        string is cached and reused across every prompt built from it.
+        """
+        if self._context_string is None:
+            if self._names is None:
+                self._build_columns()
+            self._context_string = "\n".join(
+                f"{name}: {value:.2f} ({change:+.2f}%)" if change
+                else f"{name}: {value:.2f} "
+                for name, value, change in zip(self._names, self._values, self._change_pcts)
+            )
+        return self._context_string
 
     model_config = {"frozen": False}
 
@@ -105,26 +217,63 @@ class MarketSnapshot(BaseModel):
 # Gate Check Models
 # ============================================================================
 
+# Templates for gate reasons, rendered lazily from (reason_code, reason_params)
+# only when a reason is actually logged or persisted
+GATE_REASON_TEMPLATES: Dict[str, str] = {
+    # content_quality
+    "missing_title": "Missing title",
+    "missing_content": "Missing content",
+    "content_too_short": "Content too short: {length} < {min_length} chars",
+    "content_too_long": "Content too long: {length} > {max_length} chars",
+    "spanish_ratio_low": "Spanish ratio too low: {ratio:.2f} < {required}",
+    "content_ok": "Quality checks passed (length: {length}, spanish: {ratio:.2f})",
+    # topic_relevance
+    "keywords_insufficient": "Insufficient keyword matches: {count} < {required}",
+    "keywords_ok": "Found {count} relevant keywords (e.g., {sample})",
+    "keywords_ok_dominant": (
+        "Found {count} relevant keywords (e.g., {sample}) "
+        "[dominant_category={dominant}]"
+    ),
+    # duplicate_detection
+    "duplicate_hash": "Duplicate content hash: {hash_prefix}...",
+    "duplicate_title": "Similar title found: '{title}'",
+    "no_duplicates": "No duplicates detected",
+    # temporal_relevance
+    "article_too_old": "Article too old: {age_hours:.1f} hours (max: {max_hours}, source: {source})",
+    "article_recent": "Article is recent: {age_hours:.1f} hours old (source: {source})",
+}
+
+
 class GateCheckResult(BaseModel):
     """Result of a gate check on an article."""
 
     article_id: str
     gate_name: str
     gate_result: GateResult
-    gate_reason: str
-    checked_at: datetime = Field(default_factory=datetime.now)
-    date_partition: str = Field(default="")
+    reason_code: str = ""
+    reason_params: Optional[Dict[str, Any]] = Field(default=None, exclude=True)
+    checked_at: datetime = Field(default_factory=now_cached)
 
-    @field_validator("date_partition", mode="before")
+    @field_validator("gate_name", "reason_code", mode="before")
     @classmethod
-    def compute_date_partition(cls, v, info):
-        """Compute date partition from checked_at."""
-        if not v and "checked_at" in info.data:
-            checked_at = info.data["checked_at"]
-            if isinstance(checked_at, str):
-                checked_at = datetime.fromisoformat(checked_at)
-            return checked_at.strftime("%Y-%m-%d")
-        return v
+    def intern_small_strings(cls, v):
+        """Intern gate names and reason codes, which repeat per article."""
+        return sys.intern(v) if isinstance(v, str) else v
+
+    @computed_field
+    @property
+    def gate_reason(self) -> str:
+        """Render the human-readable reason lazily from its template."""
+        template = GATE_REASON_TEMPLATES.get(self.reason_code)
+        if template is None:
+            return self.reason_code
+        return template.format(**(self.reason_params or {}))
+
+    @computed_field
+    @cached_property
+    def date_partition(self) -> str:
+        """Date partition derived from checked_at, computed once on access."""
+        return _format_date_partition(self.checked_at)
 
     @property
     def passed(self) -> bool:
@@ -148,9 +297,13 @@ class SummarizationOutput(BaseModel):
     @classmethod
     def validate_summary(cls, v):
         """Ensure summary is not empty."""
-        if not v or len(v.strip()) < 10:
+        # Cheap length check first; strip only once and return that value
+        if not v or len(v) < 10:
+            raise ValueError("Summary must be at least 10 characters")
+        stripped = v.strip()
+        if len(stripped) < 10:
             raise ValueError("Summary must be at least 10 characters")
-        return v.strip()
+        return stripped
 
 
 class TopicExtractionOutput(BaseModel):
@@ -160,6 +313,15 @@ class TopicExtractionOutput(BaseModel):
     cot_reasoning: str
     confidence: float = Field(ge=0.0, le=1.0)
 
+    @property
+    def is_low_signal(self) -> bool:
+        """True when no market-relevant topic was found.
+
+        Articles classified as nothing but OTHER carry no USD/COP
+        signal, so the impact and ranking steps can be skipped.
+        """
+        return all(topic == TopicCategory.OTHER for topic in self.topics)
+
     @field_validator("topics")
     @classmethod
     def validate_topics(cls, v):
@@ -216,9 +378,22 @@ class RankingOutput(BaseModel):
     @classmethod
     def validate_justification(cls, v):
         """Ensure justification is meaningful."""
-        if not v or len(v.strip()) < 20:
+        # Cheap length check first; strip only once and return that value
+        if not v or len(v) < 20:
+            raise ValueError("Justification must be at least 20 characters")
+        stripped = v.strip()
+        if len(stripped) < 20:
             raise ValueError("Justification must be at least 20 characters")
-        return v.strip()
+        return stripped
+
+
+class FusedOutput(BaseModel):
+    """Combined output of all 4 chain steps from a single fused LLM call."""
+
+    summarization: SummarizationOutput
+    topic_extraction: TopicExtractionOutput
+    impact_analysis: ImpactAnalysisOutput
+    ranking: RankingOutput
 
 
 class ProcessedNews(BaseModel):
@@ -232,7 +407,7 @@ class ProcessedNews(BaseModel):
     input_tokens: int = 0
     output_tokens: int = 0
     processing_time_ms: int = 0
-    processed_at: datetime = Field(default_factory=datetime.now)
+    processed_at: datetime = Field(default_factory=now_cached)
 
     # Chain outputs (stored as JSON strings in Parquet)
     summary: Optional[str] = None
@@ -248,43 +423,63 @@ class ProcessedNews(BaseModel):
     impact_time_horizon: Optional[TimeHorizon] = None
     impact_cot: Optional[str] = None
 
-    ranking_score: Optional[int] = None
+    ranking_score: Optional[int] = Field(default=None, ge=1, le=5)
     ranking_category: Optional[RankingCategory] = None
     ranking_justification: Optional[str] = None
     ranking_trader_action: Optional[TraderAction] = None
     ranking_cot: Optional[str] = None
 
-    # Partition key
-    date_partition: str = Field(default="")
-
-    @field_validator("date_partition", mode="before")
-    @classmethod
-    def compute_date_partition(cls, v, info):
-        """Compute date partition from processed_at."""
-        if not v and "processed_at" in info.data:
-            processed_at = info.data["processed_at"]
-            if isinstance(processed_at, str):
-                processed_at = datetime.fromisoformat(processed_at)
-            return processed_at.strftime("%Y-%m-%d")
-        return v
+    # Partition key, derived from processed_at
+    @computed_field
+    @cached_property
+    def date_partition(self) -> str:
+        """Date partition derived from processed_at, computed once on access."""
+        return _format_date_partition(self.processed_at)
 
     @property
     def total_tokens(self) -> int:
         """Get total tokens used."""
         return self.input_tokens + self.output_tokens
 
-    @property
+    @cached_property
     def cost_usd(self) -> float:
-        """Calculate cost in USD."""
-        from src.config.constants import (
-            ANTHROPIC_INPUT_COST_PER_1M,
-            ANTHROPIC_OUTPUT_COST_PER_1M
-        )
+        """Calculate cost in USD (computed once per instance)."""
         input_cost = (self.input_tokens / 1_000_000) * ANTHROPIC_INPUT_COST_PER_1M
         output_cost = (self.output_tokens / 1_000_000) * ANTHROPIC_OUTPUT_COST_PER_1M
         return input_cost + output_cost
 
-    model_config = {"frozen": False}
+    @cached_property
+    def formatted_detail(self) -> str:
+        """Pre-rendered detail block for daily-analysis prompts.
+
+        Position-independent (the "Noticia #N" header is added by the
+        caller) and cached so backfills and report re-renders format
+        each article once.
+        """
+        summary = self.summary or "N/A"
+        category = self.ranking_category.value if self.ranking_category else "N/A"
+        topics = ", ".join([t.value for t in self.topics]) if self.topics else "N/A"
+        direction = self.impact_direction.value if self.impact_direction else "N/A"
+        confidence = (
+            f"{self.impact_confidence:.2f}"
+            if self.impact_confidence is not None else "0.00"
+        )
+        justification = self.ranking_justification or "N/A"
+
+        return (
+            f"- ID: {self.article_id}\n"
+            f"- Título: {summary[:200]}...\n"
+            f"- Ranking: {self.ranking_score}/5 ({category})\n"
+            f"- Topics: {topics}\n"
+            f"- Impacto USD/COP: {direction}\n"
+            f"- Confianza: {confidence}\n"
+            f"- Justificación: {justification}\n"
+            f"- Resumen: {summary}"
+        )
+
+    # Chain outputs are write-once; freezing lets pydantic-core skip the
+    # mutable-setattr machinery on the pipeline's highest-volume model
+    model_config = {"frozen": True}
 
 
 # ============================================================================
@@ -324,7 +519,7 @@ class DailySummary(BaseModel):
     # Gate breakdown
     gate_failures: Dict[str, int] = Field(default_factory=dict)  # gate_name -> fail_count
 
-    created_at: datetime = Field(default_factory=datetime.now)
+    created_at: datetime = Field(default_factory=now_cached)
 
     model_config = {"frozen": False}
 
@@ -348,10 +543,13 @@ class PipelineState(BaseModel):
     impact_analysis: Optional[ImpactAnalysisOutput] = None
     ranking: Optional[RankingOutput] = None
 
+    # Fused-mode output: all 4 steps from a single LLM call
+    fused: Optional[FusedOutput] = None
+
     # Metadata
     tokens_used: int = 0
     errors: List[str] = Field(default_factory=list)
-    started_at: datetime = Field(default_factory=datetime.now)
+    started_at: datetime = Field(default_factory=now_cached)
     completed_at: Optional[datetime] = None
 
     @property
@@ -365,3 +563,15 @@ class PipelineState(BaseModel):
         return len(self.errors) > 0
 
     model_config = {"frozen": False, "arbitrary_types_allowed": True}
+
+# ============================================================================
+# Bulk Validation Adapters
+# ============================================================================
+
+# Validating a list in one TypeAdapter call keeps the whole batch inside
+# pydantic-core instead of re-entering Python per instance; built once at
+# import so the validators are compiled up front
+RAW_NEWS_LIST_ADAPTER = TypeAdapter(List[RawNews])
+MARKET_INDICATOR_LIST_ADAPTER = TypeAdapter(List[MarketIndicator])
+GATE_CHECK_LIST_ADAPTER = TypeAdapter(List[GateCheckResult])
+PROCESSED_NEWS_LIST_ADAPTER = TypeAdapter(List[ProcessedNews])
@@ -1,13 +1,44 @@
 """Structured logging configuration."""
 
+import atexit
 import logging
+import queue
 import sys
 import json
-from datetime import datetime
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Any, Dict
 
-from src.config.settings import settings
+# Cached single-value accessors instead of the full Settings object;
+# aliased because setup_logging's parameters share their names
+from src.config.settings import log_format as default_log_format
+from src.config.settings import log_level as default_log_level
+
+# orjson serializes 3-10x faster than the stdlib; fall back when absent
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Timestamp string cached at second granularity — log records within the
+# same second reuse it instead of re-running isoformat
+_ts_second = -1
+_ts_string = ""
+
+
+def _utc_timestamp() -> str:
+    """Get the current UTC timestamp string, cached per second."""
+    global _ts_second, _ts_string
+    second = int(time.time())
+    if second != _ts_second:
+        _ts_second = second
+        _ts_string = (
+            datetime.fromtimestamp(second, tz=timezone.utc)
+            .strftime("%Y-%m-%dT%H:%M:%S") + "Z"
+        )
+    return _ts_string
 
 
 class JSONFormatter(logging.Formatter):
@@ -23,7 +54,7 @@ class JSONFormatter(logging.Formatter):
             JSON-formatted log string
         """
         log_data: Dict[str, Any] = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": _utc_timestamp(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -40,6 +71,8 @@ class JSONFormatter(logging.Formatter):
         if hasattr(record, "extra_fields"):
             log_data.update(record.extra_fields)
 
+        if orjson is not None:
+            return orjson.dumps(log_data).decode()
         return json.dumps(log_data)
 
 
@@ -54,6 +87,22 @@ class TextFormatter(logging.Formatter):
         )
 
 
+# Listener draining the log queue on a background thread; replaced if
+# setup_logging is called again
+_queue_listener: QueueListener = None
+
+
+def _stop_queue_listener() -> None:
+    """Stop the active queue listener, flushing queued records."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
 def setup_logging(
     log_level: str = None,
     log_format: str = None,
@@ -61,14 +110,20 @@ def setup_logging(
 ) -> None:
     """Setup logging configuration.
 
+    Handlers are driven through a QueueHandler/QueueListener pair so
+    emitting a record on the hot path is just a queue put; formatting
+    and console/file I/O happen on a background thread.
+
     Args:
         log_level: Log level (default: from settings)
         log_format: Log format - "json" or "text" (default: from settings)
         log_file: Optional file path for logging
     """
+    global _queue_listener
+
     # Use settings if not provided
-    log_level = log_level or settings.log_level
-    log_format = log_format or settings.log_format
+    log_level = log_level or default_log_level()
+    log_format = log_format or default_log_format()
 
     # Convert log level string to logging constant
     numeric_level = getattr(logging, log_level.upper(), logging.INFO)
@@ -79,28 +134,41 @@ def setup_logging(
     else:
         formatter = TextFormatter()
 
-    # Setup root logger
-    root_logger = logging.getLogger()
-    root_logger.setLevel(numeric_level)
-
-    # Remove existing handlers
-    root_logger.handlers.clear()
-
-    # Add console handler
+    # Build the real handlers; the listener owns them
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(numeric_level)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers = [console_handler]
 
-    # Add file handler if log_file specified
+    # Add file handler if log_file specified (opened lazily via delay=True)
     if log_file:
         log_file = Path(log_file)
         log_file.parent.mkdir(parents=True, exist_ok=True)
 
-        file_handler = logging.FileHandler(log_file)
+        file_handler = RotatingFileHandler(
+            log_file,
+            maxBytes=50 * 1024 * 1024,
+            backupCount=5,
+            delay=True
+        )
         file_handler.setLevel(numeric_level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # Stop the previous listener before replacing it
+    _stop_queue_listener()
+
+    log_queue = queue.Queue(maxsize=10000)
+    _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+
+    # Setup root logger: only the queue handler sits on the hot path
+    root_logger = logging.getLogger()
+    root_logger.setLevel(numeric_level)
+
+    # Remove existing handlers
+    root_logger.handlers.clear()
+    root_logger.addHandler(QueueHandler(log_queue))
 
     # Reduce noise from verbose libraries
     logging.getLogger("anthropic").setLevel(logging.WARNING)
@@ -111,20 +179,26 @@ def setup_logging(
     root_logger.info(f"Logging configured: level={log_level}, format={log_format}")
 
 
-def log_with_context(logger: logging.Logger, level: str, message: str, **context):
+def log_with_context(logger: logging.Logger, level: str, message: str, *args, **context):
     """Log message with additional context fields.
 
+    Returns before doing any work when the level is filtered out, so
+    calls on disabled levels are nearly free. Pass %-style args instead
+    of pre-formatted strings to defer message formatting the same way.
+
     Args:
         logger: Logger instance
         level: Log level ("debug", "info", "warning", "error", "critical")
-        message: Log message
+        message: Log message (may contain %-style placeholders)
+        *args: Arguments for %-style placeholders, formatted lazily
         **context: Additional context fields
     """
-    log_func = getattr(logger, level.lower())
+    numeric_level = getattr(logging, level.upper(), logging.INFO)
+    if not logger.isEnabledFor(numeric_level):
+        return
 
-    # Create a log record with extra fields
-    extra = {"extra_fields": context}
-    log_func(message, extra=extra)
+    # Build the extra-fields dict only for records that will be emitted
+    logger.log(numeric_level, message, *args, extra={"extra_fields": context})
 
 
 # Setup logging on module import
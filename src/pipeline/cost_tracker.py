@@ -2,6 +2,8 @@
 
 import logging
 from typing import List
+
+import numpy as np
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -52,12 +54,76 @@ class CostReport:
 class CostTracker:
     """Tracker for LLM API costs and token usage."""
 
-    def __init__(self):
-        """Initialize cost tracker."""
+    def __init__(self, keep_breakdown: bool = False):
+        """Initialize cost tracker.
+
+        Args:
+            keep_breakdown: Whether to keep a per-article cost breakdown;
+                off by default since it grows with the batch size while
+                report aggregates are maintained incrementally
+        """
         self.total_input_tokens = 0
         self.total_output_tokens = 0
         self.total_cost_usd = 0.0
-        self.article_costs: List[dict] = []
+        self.keep_breakdown = keep_breakdown
+        self._count = 0
+        self._min_cost = float("inf")
+        self._max_cost = 0.0
+        self._total_processing_time_ms = 0
+        self._init_breakdown_columns()
+
+    def _init_breakdown_columns(self, capacity: int = 256):
+        """Allocate the columnar (SoA) breakdown storage.
+
+        Numeric columns live in pre-allocated numpy arrays grown
+        geometrically; only article ids and ranking scores stay as Python
+        lists (strings and optional values dominate there anyway).
+
+        Args:
+            capacity: Initial column capacity
+        """
+        self._article_ids: List[str] = []
+        self._ranking_scores: List = []
+        self._capacity = capacity
+        self._input_tokens_col = np.empty(capacity, dtype=np.int32)
+        self._output_tokens_col = np.empty(capacity, dtype=np.int32)
+        self._cost_col = np.empty(capacity, dtype=np.float32)
+        self._processing_time_col = np.empty(capacity, dtype=np.int32)
+
+    def _grow_breakdown_columns(self):
+        """Double the capacity of the numeric breakdown columns."""
+        self._capacity *= 2
+        for attr in ("_input_tokens_col", "_output_tokens_col",
+                     "_cost_col", "_processing_time_col"):
+            column = getattr(self, attr)
+            grown = np.empty(self._capacity, dtype=column.dtype)
+            grown[:len(self._article_ids)] = column[:len(self._article_ids)]
+            setattr(self, attr, grown)
+
+    @property
+    def article_costs(self) -> List[dict]:
+        """Materialize the per-article breakdown from the columns."""
+        count = len(self._article_ids)
+        return [
+            {
+                "article_id": article_id,
+                "input_tokens": int(input_tokens),
+                "output_tokens": int(output_tokens),
+                "total_tokens": int(input_tokens) + int(output_tokens),
+                "cost_usd": float(cost_usd),
+                "ranking_score": ranking_score,
+                "processing_time_ms": int(processing_time_ms)
+            }
+            for article_id, input_tokens, output_tokens, cost_usd,
+                ranking_score, processing_time_ms in zip(
+                self._article_ids,
+                self._input_tokens_col[:count],
+                self._output_tokens_col[:count],
+                self._cost_col[:count],
+                self._ranking_scores,
+                self._processing_time_col[:count]
+            )
+        ]
 
     def add_processed_article(self, processed: ProcessedNews):
         """Add a processed article to tracking.
@@ -73,15 +139,24 @@ class CostTracker:
         self.total_output_tokens += output_tokens
         self.total_cost_usd += cost_usd
 
-        self.article_costs.append({
-            "article_id": processed.article_id,
-            "input_tokens": input_tokens,
-            "output_tokens": output_tokens,
-            "total_tokens": processed.total_tokens,
-            "cost_usd": cost_usd,
-            "ranking_score": processed.ranking_score,
-            "processing_time_ms": processed.processing_time_ms
-        })
+        # Streamed aggregates, so report generation stays O(1)
+        self._count += 1
+        if cost_usd < self._min_cost:
+            self._min_cost = cost_usd
+        if cost_usd > self._max_cost:
+            self._max_cost = cost_usd
+        self._total_processing_time_ms += processed.processing_time_ms
+
+        if self.keep_breakdown:
+            index = len(self._article_ids)
+            if index >= self._capacity:
+                self._grow_breakdown_columns()
+            self._article_ids.append(processed.article_id)
+            self._ranking_scores.append(processed.ranking_score)
+            self._input_tokens_col[index] = input_tokens
+            self._output_tokens_col[index] = output_tokens
+            self._cost_col[index] = cost_usd
+            self._processing_time_col[index] = processed.processing_time_ms
 
     def get_total_tokens(self) -> int:
         """Get total tokens used."""
@@ -89,15 +164,15 @@ class CostTracker:
 
     def get_average_cost_per_article(self) -> float:
         """Get average cost per article."""
-        if not self.article_costs:
+        if not self._count:
             return 0.0
-        return self.total_cost_usd / len(self.article_costs)
+        return self.total_cost_usd / self._count
 
     def get_average_tokens_per_article(self) -> float:
         """Get average tokens per article."""
-        if not self.article_costs:
+        if not self._count:
             return 0.0
-        return self.get_total_tokens() / len(self.article_costs)
+        return self.get_total_tokens() / self._count
 
     def generate_report(self, date: str = None) -> CostReport:
         """Generate cost report.
@@ -111,25 +186,22 @@ class CostTracker:
         if date is None:
             date = datetime.now().strftime("%Y-%m-%d")
 
-        if not self.article_costs:
+        if not self._count:
             logger.warning("No articles tracked, returning empty report")
             return CostReport(date=date)
 
-        costs = [a["cost_usd"] for a in self.article_costs]
-        total_processing_time = sum(a["processing_time_ms"] for a in self.article_costs)
-
         report = CostReport(
             date=date,
-            total_articles=len(self.article_costs),
+            total_articles=self._count,
             total_input_tokens=self.total_input_tokens,
             total_output_tokens=self.total_output_tokens,
             total_tokens=self.get_total_tokens(),
             total_cost_usd=self.total_cost_usd,
             avg_tokens_per_article=self.get_average_tokens_per_article(),
             avg_cost_per_article=self.get_average_cost_per_article(),
-            min_cost_article=min(costs),
-            max_cost_article=max(costs),
-            processing_time_ms=total_processing_time,
+            min_cost_article=self._min_cost,
+            max_cost_article=self._max_cost,
+            processing_time_ms=self._total_processing_time_ms,
             cost_breakdown=self.article_costs
         )
 
@@ -162,7 +234,11 @@ class CostTracker:
         self.total_input_tokens = 0
         self.total_output_tokens = 0
         self.total_cost_usd = 0.0
-        self.article_costs = []
+        self._init_breakdown_columns()
+        self._count = 0
+        self._min_cost = float("inf")
+        self._max_cost = 0.0
+        self._total_processing_time_ms = 0
         logger.info("Cost tracker reset")
 
 
@@ -1,24 +1,23 @@
 """Main pipeline orchestrator - coordinates all components."""
 
 import argparse
+import asyncio
 import logging
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
 
 from src.config.settings import settings
-from src.scrapers.news_scraper import scrape_cnn_colombia
-from src.scrapers.market_scraper import scrape_market_data
 from src.gates.base import GatePipeline
 from src.gates.content_quality import ContentQualityGate
 from src.gates.topic_relevance import TopicRelevanceGate
 from src.gates.duplicate_detection import DuplicateDetectionGate
 from src.gates.temporal_relevance import TemporalRelevanceGate
 from src.processors.chain_executor import ChainExecutor
-from src.storage.local_parquet import ParquetStorage
+from src.storage.local_parquet import ParquetStorage, ProcessedNewsStreamWriter
 from src.pipeline.cost_tracker import CostTracker
-from src.pipeline.daily_analysis import generate_daily_report
 from src.models.schemas import RawNews, MarketSnapshot, ProcessedNews, GateCheckResult
+from src.models.enums import TopicCategory
 from src.monitoring.logger import setup_logging
 
 logger = logging.getLogger(__name__)
@@ -58,6 +57,10 @@ class PipelineOrchestrator:
         # Initialize cost tracker
         self.cost_tracker = CostTracker()
 
+        # Dominant topic per article, harvested from keyword-gate evidence
+        # during run_gates so run_processing can skip the topic LLM call
+        self._dominant_topics: dict[str, TopicCategory] = {}
+
     def run_scraping(
         self,
         max_articles: Optional[int] = None,
@@ -72,6 +75,11 @@ class PipelineOrchestrator:
         Returns:
             Tuple of (articles, market_snapshot)
         """
+        # Imported here so gate/process-only invocations never pay for
+        # the scraping stack (BeautifulSoup, HTTP clients)
+        from src.scrapers.news_scraper import scrape_cnn_colombia
+        from src.scrapers.market_scraper import scrape_market_data
+
         logger.info("=" * 60)
         logger.info("PHASE 1: SCRAPING")
         logger.info("=" * 60)
@@ -82,25 +90,73 @@ class PipelineOrchestrator:
             max_articles=max_articles,
             skip_empty_content=True
         )
-        logger.info(f"Scraped {len(articles)} articles")
+        logger.info("Scraped %d articles", len(articles))
 
         # Save raw news to Parquet
         if articles:
             filepath = self.storage.write_raw_news(articles, date=date)
-            logger.info(f"Saved raw news to {filepath}")
+            logger.info("Saved raw news to %s", filepath)
 
         # Scrape market data
         logger.info("Scraping market data...")
         market_snapshot = scrape_market_data(include_google_finance=False)
         valid_indicators = len([i for i in market_snapshot.indicators.values() if i.error is None])
-        logger.info(f"Scraped {valid_indicators}/{len(market_snapshot.indicators)} market indicators")
+        logger.info("Scraped %d/%d market indicators", valid_indicators, len(market_snapshot.indicators))
 
         # Save market snapshot to Parquet
         filepath = self.storage.write_market_snapshot(market_snapshot, date=date)
-        logger.info(f"Saved market snapshot to {filepath}")
+        logger.info("Saved market snapshot to %s", filepath)
 
         return articles, market_snapshot
 
+    @staticmethod
+    def _dedup_by_content(articles: List[RawNews]) -> List[RawNews]:
+        """Drop exact content duplicates before gating.
+
+        Duplicates are detected by content hash, so they never reach
+        the gate pipeline or the LLM chain.
+
+        Args:
+            articles: Scraped articles in arrival order
+
+        Returns:
+            Articles with later exact duplicates removed
+        """
+        seen_hashes: set = set()
+        unique_articles = []
+
+        for article in articles:
+            if article.hash_content:
+                if article.hash_content in seen_hashes:
+                    logger.info(
+                        "  ✗ Skipping duplicate content (hash %s...)",
+                        article.hash_content[:8]
+                    )
+                    continue
+                seen_hashes.add(article.hash_content)
+            unique_articles.append(article)
+
+        return unique_articles
+
+    def _record_dominant_topic(
+        self,
+        article: RawNews,
+        gate_results: List[GateCheckResult]
+    ) -> None:
+        """Remember the dominant keyword category harvested by a gate.
+
+        The chain executor uses it to skip the topic-extraction LLM call.
+
+        Args:
+            article: Article that passed the gates
+            gate_results: Gate results for that article
+        """
+        for result in gate_results:
+            if result.reason_code == "keywords_ok_dominant":
+                self._dominant_topics[article.article_id] = TopicCategory(
+                    result.reason_params["dominant"]
+                )
+
     def run_gates(
         self,
         articles: List[RawNews],
@@ -122,43 +178,121 @@ class PipelineOrchestrator:
         passed_articles = []
         all_gate_results = []
 
-        for i, article in enumerate(articles, 1):
-            logger.info(f"Checking article {i}/{len(articles)}: {article.title[:50]}...")
+        unique_articles = self._dedup_by_content(articles)
 
-            # Run gates (fail-fast)
-            passed, gate_results = self.gate_pipeline.run(article)
+        # Run the gate pipeline across articles in parallel; run_batch
+        # preserves input order, so logging below stays deterministic
+        batch_results = self.gate_pipeline.run_batch(unique_articles)
+
+        total_unique = len(unique_articles)
+        for i, (article, (passed, gate_results)) in enumerate(
+            zip(unique_articles, batch_results), 1
+        ):
+            logger.info(
+                "Checking article %d/%d: %s...", i, total_unique, article.title[:50]
+            )
 
             # Collect all results
             all_gate_results.extend(gate_results)
 
             if passed:
                 passed_articles.append(article)
-                logger.info(f"  ✓ Article passed all gates")
+                logger.info("  ✓ Article passed all gates")
+                self._record_dominant_topic(article, gate_results)
             else:
                 failed_gate = gate_results[-1]  # Last gate that failed
-                logger.info(f"  ✗ Article failed gate '{failed_gate.gate_name}': {failed_gate.gate_reason}")
+                logger.info("  ✗ Article failed gate '%s': %s", failed_gate.gate_name, failed_gate.gate_reason)
 
         # Save gate results to Parquet
         if all_gate_results:
             filepath = self.storage.write_gate_checks(all_gate_results, date=date)
-            logger.info(f"Saved {len(all_gate_results)} gate results to {filepath}")
+            logger.info("Saved %d gate results to %s", len(all_gate_results), filepath)
 
-        logger.info(f"\nGate Summary: {len(passed_articles)}/{len(articles)} articles passed")
+        logger.info("\nGate Summary: %d/%d articles passed", len(passed_articles), len(articles))
 
         return passed_articles, all_gate_results
 
+    async def _process_articles_async(
+        self,
+        articles: List[RawNews],
+        market_snapshot: MarketSnapshot,
+        max_concurrency: int,
+        on_processed=None
+    ) -> List[ProcessedNews]:
+        """Process articles concurrently, bounded by a semaphore.
+
+        The 4-step chain is I/O-bound on LLM calls, so overlapping
+        articles is the dominant wall-clock win; the semaphore keeps
+        in-flight requests under the provider rate limit.
+
+        Args:
+            articles: Articles to process
+            market_snapshot: Current market context
+            max_concurrency: Maximum articles in flight at once
+            on_processed: Optional callback invoked with each article as
+                it completes (e.g. a streaming Parquet writer)
+
+        Returns:
+            List of ProcessedNews objects (failed articles are dropped)
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        total = len(articles)
+
+        async def process_one(index: int, article: RawNews) -> ProcessedNews:
+            async with semaphore:
+                logger.info(
+                    "Processing article %d/%d: %s...", index, total, article.title[:60]
+                )
+                dominant = self._dominant_topics.get(article.article_id)
+                processed = await self.chain_executor.aexecute_full_chain(
+                    article,
+                    market_snapshot,
+                    precomputed_topics=[dominant] if dominant else None
+                )
+                # Callbacks run on the event loop, so no locking needed
+                if on_processed is not None:
+                    on_processed(processed)
+                return processed
+
+        results = await asyncio.gather(
+            *(process_one(i, article) for i, article in enumerate(articles, 1)),
+            return_exceptions=True
+        )
+
+        processed_articles = []
+        for article, result in zip(articles, results):
+            if isinstance(result, BaseException):
+                logger.error("  ✗ Failed to process article %s: %s", article.article_id, result)
+            else:
+                processed_articles.append(result)
+
+        return processed_articles
+
     def run_processing(
         self,
         articles: List[RawNews],
         market_snapshot: MarketSnapshot,
-        date: Optional[datetime] = None
+        date: Optional[datetime] = None,
+        max_concurrency: int = 5,
+        batch_size: Optional[int] = None
     ) -> List[ProcessedNews]:
         """Run LLM processing phase: analyze articles with chain prompting.
 
+        By default articles run through the 4-step chain concurrently
+        (bounded by max_concurrency). When batch_size is set, articles
+        are instead packed into combined prompts of that size — fewer,
+        larger LLM calls that share the instruction prefix, trading some
+        per-article chain fidelity for token and round-trip savings.
+        Costs are summed in this driver after processing completes, so
+        no locking is needed in the workers.
+
         Args:
             articles: List of articles that passed gates
             market_snapshot: Current market context
             date: Date for storage partitioning (default: today)
+            max_concurrency: Maximum articles processed in parallel
+            batch_size: Articles per combined LLM call; None keeps the
+                concurrent per-article chain
 
         Returns:
             List of ProcessedNews objects
@@ -167,36 +301,49 @@ class PipelineOrchestrator:
         logger.info("PHASE 3: LLM PROCESSING")
         logger.info("=" * 60)
 
-        processed_articles = []
-
-        for i, article in enumerate(articles, 1):
-            logger.info(f"\nProcessing article {i}/{len(articles)}: {article.title[:60]}...")
+        # Stream rows to Parquet as articles complete: a crash mid-run
+        # keeps everything finished so far, and no full-day list has to
+        # be rebuilt into a DataFrame at the end
+        with ProcessedNewsStreamWriter(self.storage.base_dir, date=date) as writer:
+            if batch_size:
+                processed_articles = self.chain_executor.execute_batch(
+                    articles, market_snapshot, batch_size=batch_size
+                )
+                for processed in processed_articles:
+                    writer.append(processed)
+            else:
+                processed_articles = asyncio.run(
+                    self._process_articles_async(
+                        articles, market_snapshot, max_concurrency,
+                        on_processed=writer.append
+                    )
+                )
 
-            try:
-                # Execute full chain
-                processed = self.chain_executor.execute_full_chain(article, market_snapshot)
+        # Track costs once the tasks are done (lock-free additive pattern)
+        for processed in processed_articles:
+            self.cost_tracker.add_processed_article(processed)
+            logger.info(
+                "  ✓ Completed: Score=%s, Category=%s, Cost=$%.4f",
+                processed.ranking_score,
+                processed.ranking_category.value,
+                processed.cost_usd
+            )
 
-                # Track costs
-                self.cost_tracker.add_processed_article(processed)
+        if processed_articles:
+            logger.info(
+                "\nSaved %d processed articles to %s", writer.count, writer.filepath
+            )
 
-                processed_articles.append(processed)
+        self._report_costs(date)
 
-                logger.info(
-                    f"  ✓ Completed: Score={processed.ranking_score}, "
-                    f"Category={processed.ranking_category.value}, "
-                    f"Cost=${processed.cost_usd:.4f}"
-                )
+        return processed_articles
 
-            except Exception as e:
-                logger.error(f"  ✗ Failed to process article: {e}")
-                continue
+    def _report_costs(self, date: Optional[datetime]) -> None:
+        """Log the cost report and check the daily cost threshold.
 
-        # Save processed articles to Parquet
-        if processed_articles:
-            filepath = self.storage.write_processed_news(processed_articles, date=date)
-            logger.info(f"\nSaved {len(processed_articles)} processed articles to {filepath}")
-
-        # Generate cost report
+        Args:
+            date: Date the report covers (default: today)
+        """
         cost_report = self.cost_tracker.generate_report(
             date=date.strftime("%Y-%m-%d") if date else None
         )
@@ -204,18 +351,164 @@ class PipelineOrchestrator:
         logger.info("\n" + "=" * 60)
         logger.info("COST REPORT")
         logger.info("=" * 60)
-        logger.info(f"Total articles: {cost_report.total_articles}")
+        logger.info("Total articles: %d", cost_report.total_articles)
         logger.info(f"Total tokens: {cost_report.total_tokens:,}")
-        logger.info(f"Total cost: ${cost_report.total_cost_usd:.4f}")
-        logger.info(f"Avg cost/article: ${cost_report.avg_cost_per_article:.4f}")
-        logger.info(f"Avg tokens/article: {cost_report.avg_tokens_per_article:.1f}")
+        logger.info("Total cost: $%.4f", cost_report.total_cost_usd)
+        logger.info("Avg cost/article: $%.4f", cost_report.avg_cost_per_article)
+        logger.info("Avg tokens/article: %.1f", cost_report.avg_tokens_per_article)
 
-        # Check cost threshold
         if settings.enable_cost_alerts:
             self.cost_tracker.check_cost_threshold(settings.daily_cost_threshold_usd)
 
+    async def _gates_and_processing_async(
+        self,
+        articles: List[RawNews],
+        market_snapshot: MarketSnapshot,
+        max_concurrency: int,
+        passed_articles: List[RawNews],
+        all_gate_results: List[GateCheckResult],
+        on_processed=None
+    ) -> List[ProcessedNews]:
+        """Overlap gate checks with LLM processing via a bounded queue.
+
+        A producer runs the (CPU-bound) gate pipeline in the default
+        thread executor and feeds passing articles to async LLM workers
+        as soon as each clears the gates, so the network is busy while
+        later articles are still being gated. The queue bound keeps the
+        producer from racing arbitrarily far ahead.
+
+        Args:
+            articles: Deduplicated articles to gate and process
+            market_snapshot: Current market context
+            max_concurrency: Number of LLM workers
+            passed_articles: Output list; filled in gate order
+            all_gate_results: Output list; filled in gate order
+            on_processed: Optional callback invoked with each article as
+                it completes (e.g. a streaming Parquet writer)
+
+        Returns:
+            List of ProcessedNews objects (failed articles are dropped)
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=32)
+        processed_articles: List[ProcessedNews] = []
+        total = len(articles)
+        loop = asyncio.get_running_loop()
+
+        async def produce() -> None:
+            for i, article in enumerate(articles, 1):
+                logger.info(
+                    "Checking article %d/%d: %s...", i, total, article.title[:50]
+                )
+                passed, gate_results = await loop.run_in_executor(
+                    None, self.gate_pipeline.run, article
+                )
+                all_gate_results.extend(gate_results)
+
+                if passed:
+                    logger.info("  ✓ Article passed all gates")
+                    self._record_dominant_topic(article, gate_results)
+                    passed_articles.append(article)
+                    await queue.put(article)
+                else:
+                    failed_gate = gate_results[-1]
+                    logger.info(
+                        "  ✗ Article failed gate '%s': %s",
+                        failed_gate.gate_name, failed_gate.gate_reason
+                    )
+
+            # One sentinel per worker shuts the pool down cleanly
+            for _ in range(max_concurrency):
+                await queue.put(None)
+
+        async def consume() -> None:
+            while True:
+                article = await queue.get()
+                if article is None:
+                    return
+                try:
+                    dominant = self._dominant_topics.get(article.article_id)
+                    result = await self.chain_executor.aexecute_full_chain(
+                        article,
+                        market_snapshot,
+                        precomputed_topics=[dominant] if dominant else None
+                    )
+                except Exception as e:
+                    logger.error(
+                        "  ✗ Failed to process article %s: %s",
+                        article.article_id, e
+                    )
+                    continue
+                processed_articles.append(result)
+                # Callbacks run on the event loop, so no locking needed
+                if on_processed is not None:
+                    on_processed(result)
+
+        await asyncio.gather(
+            produce(), *(consume() for _ in range(max_concurrency))
+        )
+
         return processed_articles
 
+    def run_gates_and_processing(
+        self,
+        articles: List[RawNews],
+        market_snapshot: MarketSnapshot,
+        date: Optional[datetime] = None,
+        max_concurrency: int = 5
+    ) -> tuple[List[RawNews], List[GateCheckResult], List[ProcessedNews]]:
+        """Run gates and LLM processing as one overlapped phase.
+
+        Instead of gating every article before the first LLM call, each
+        gate-passing article streams straight into the LLM workers, so
+        total wall time approaches max(gate time, LLM time / workers)
+        rather than their sum.
+
+        Args:
+            articles: List of raw articles
+            market_snapshot: Current market context
+            date: Date for storage partitioning (default: today)
+            max_concurrency: Maximum articles processed in parallel
+
+        Returns:
+            Tuple of (passed_articles, all_gate_results, processed_articles)
+        """
+        logger.info("=" * 60)
+        logger.info("PHASE 2+3: GATE CHECKS + LLM PROCESSING (overlapped)")
+        logger.info("=" * 60)
+
+        passed_articles: List[RawNews] = []
+        all_gate_results: List[GateCheckResult] = []
+
+        unique_articles = self._dedup_by_content(articles)
+
+        with ProcessedNewsStreamWriter(self.storage.base_dir, date=date) as writer:
+            processed_articles = asyncio.run(
+                self._gates_and_processing_async(
+                    unique_articles, market_snapshot, max_concurrency,
+                    passed_articles, all_gate_results,
+                    on_processed=writer.append
+                )
+            )
+
+        if all_gate_results:
+            filepath = self.storage.write_gate_checks(all_gate_results, date=date)
+            logger.info("Saved %d gate results to %s", len(all_gate_results), filepath)
+
+        logger.info("\nGate Summary: %d/%d articles passed", len(passed_articles), len(articles))
+
+        # Track costs once the tasks are done (lock-free additive pattern)
+        for processed in processed_articles:
+            self.cost_tracker.add_processed_article(processed)
+
+        if processed_articles:
+            logger.info(
+                "\nSaved %d processed articles to %s", writer.count, writer.filepath
+            )
+
+        self._report_costs(date)
+
+        return passed_articles, all_gate_results, processed_articles
+
     def run_full_pipeline(
         self,
         max_articles: Optional[int] = None,
@@ -230,14 +523,17 @@ class PipelineOrchestrator:
         Returns:
             Dict with pipeline statistics
         """
+        # Capture the clock once; strftime re-parses its format string
+        # on every call, so reuse the rendered date everywhere below
         start_time = datetime.now()
+        date_str = (date or start_time).strftime("%Y-%m-%d")
 
         logger.info("\n" + "=" * 60)
         logger.info("STARTING FULL PIPELINE")
         logger.info("=" * 60)
-        logger.info(f"Date: {date or datetime.now().strftime('%Y-%m-%d')}")
-        logger.info(f"Max articles: {max_articles or 'unlimited'}")
-        logger.info(f"Mock LLM: {self.mock_llm}")
+        logger.info("Date: %s", date_str)
+        logger.info("Max articles: %s", max_articles or 'unlimited')
+        logger.info("Mock LLM: %s", self.mock_llm)
 
         # Phase 1: Scraping
         articles, market_snapshot = self.run_scraping(max_articles=max_articles, date=date)
@@ -249,8 +545,12 @@ class PipelineOrchestrator:
                 "error": "No articles scraped"
             }
 
-        # Phase 2: Gate checks
-        passed_articles, gate_results = self.run_gates(articles, date=date)
+        # Phases 2+3 overlapped: each gate-passing article streams
+        # straight into the LLM workers instead of waiting for all
+        # gates to finish
+        passed_articles, gate_results, processed_articles = (
+            self.run_gates_and_processing(articles, market_snapshot, date=date)
+        )
 
         if not passed_articles:
             logger.warning("No articles passed gates, stopping pipeline")
@@ -261,20 +561,20 @@ class PipelineOrchestrator:
                 "articles_passed_gates": 0
             }
 
-        # Phase 3: LLM processing
-        processed_articles = self.run_processing(passed_articles, market_snapshot, date=date)
-
         # Phase 4: Daily Analysis (Most Important News)
         if processed_articles:
             logger.info("\n" + "=" * 60)
             logger.info("PHASE 4: DAILY ANALYSIS")
             logger.info("=" * 60)
 
+            # Deferred import: only the full pipeline needs the analyzer
+            from src.pipeline.daily_analysis import generate_daily_report
+
             try:
                 daily_report = generate_daily_report(processed_articles, date=date)
                 logger.info("\n" + daily_report)
             except Exception as e:
-                logger.error(f"Failed to generate daily analysis: {e}")
+                logger.error("Failed to generate daily analysis: %s", e)
 
         # Calculate statistics
         end_time = datetime.now()
@@ -296,12 +596,12 @@ class PipelineOrchestrator:
         logger.info("\n" + "=" * 60)
         logger.info("PIPELINE COMPLETED")
         logger.info("=" * 60)
-        logger.info(f"Duration: {duration:.1f}s")
-        logger.info(f"Articles scraped: {stats['articles_scraped']}")
-        logger.info(f"Articles passed gates: {stats['articles_passed_gates']}")
-        logger.info(f"Articles processed: {stats['articles_processed']}")
+        logger.info("Duration: %.1fs", duration)
+        logger.info("Articles scraped: %d", stats['articles_scraped'])
+        logger.info("Articles passed gates: %d", stats['articles_passed_gates'])
+        logger.info("Articles processed: %d", stats['articles_processed'])
         logger.info(f"Gate pass rate: {stats['gate_pass_rate']:.1%}")
-        logger.info(f"Total cost: ${stats['total_cost_usd']:.4f}")
+        logger.info("Total cost: $%.4f", stats['total_cost_usd'])
 
         return stats
 
@@ -370,7 +670,7 @@ def main():
             max_articles=args.max_articles,
             date=date
         )
-        logger.info(f"Scraped {len(articles)} articles")
+        logger.info("Scraped %d articles", len(articles))
         return 0
 
     elif args.command == "gate":
@@ -381,7 +681,7 @@ def main():
             return 1
 
         passed_articles, _ = orchestrator.run_gates(articles, date=date)
-        logger.info(f"{len(passed_articles)}/{len(articles)} articles passed gates")
+        logger.info("%d/%d articles passed gates", len(passed_articles), len(articles))
         return 0
 
     elif args.command == "process":
@@ -398,7 +698,7 @@ def main():
             return 1
 
         processed = orchestrator.run_processing(articles, market_snapshot, date=date)
-        logger.info(f"Processed {len(processed)} articles")
+        logger.info("Processed %d articles", len(processed))
         return 0
 
 
@@ -2,18 +2,97 @@
 
 import json
 import logging
+import re
+import threading
+from functools import lru_cache
 from typing import Optional, Dict, Any
-from anthropic import Anthropic
 
-from src.config.settings import settings
+import httpx
+from anthropic import (
+    Anthropic, AsyncAnthropic,
+    APIConnectionError, APITimeoutError, InternalServerError, RateLimitError
+)
+
+# Cached single-value accessors instead of the full Settings object:
+# one environment read apiece, no Pydantic descriptor overhead
+from src.config.settings import anthropic_api_key, anthropic_api_keys, mock_llm
 from src.config.constants import (
     ANTHROPIC_MODEL,
     MAX_TOKENS_PER_STEP,
     TEMPERATURE
 )
+from src.utils.retry import retry_with_backoff, retry_async_with_backoff
+
+# orjson decodes 2-3x faster than the stdlib; fall back when absent
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive pool shared across the 4-step chain: warm TLS connections
+# avoid a handshake per call, and explicit timeouts bound tail latency
+_HTTP_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+_HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=16,
+    max_connections=32,
+    keepalive_expiry=60
+)
+
+# Captures the JSON body whether or not the model wrapped it in a
+# markdown code fence; one match replaces four strip/slice passes
+_JSON_FENCE = re.compile(
+    r"^\s*(?:```(?:json)?\s*)?(.*?)\s*(?:```)?\s*$", re.DOTALL
+)
+
+# Transient provider failures worth retrying; schema/auth errors are not
+_RETRYABLE_EXCEPTIONS = (
+    RateLimitError,
+    APIConnectionError,
+    APITimeoutError,
+    InternalServerError
+)
+
+
+class _JsonStreamScanner:
+    """Detects a complete top-level JSON value across streamed chunks.
+
+    Tracks brace/bracket depth while skipping string contents, so
+    braces inside JSON strings don't count. Once the top-level value
+    closes, any remaining stream is fence/whitespace tail and can be
+    ignored.
+    """
+
+    __slots__ = ("depth", "started", "in_string", "escape")
+
+    def __init__(self):
+        self.depth = 0
+        self.started = False
+        self.in_string = False
+        self.escape = False
+
+    def feed(self, chunk: str) -> bool:
+        """Feed a chunk; return True once the top-level value has closed."""
+        for ch in chunk:
+            if self.escape:
+                self.escape = False
+            elif self.in_string:
+                if ch == "\\":
+                    self.escape = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '"':
+                self.in_string = True
+            elif ch in "{[":
+                self.depth += 1
+                self.started = True
+            elif ch in "}]":
+                self.depth -= 1
+                if self.started and self.depth <= 0:
+                    return True
+        return False
+
 
 class LLMClient:
     """Wrapper for Anthropic Claude API."""
@@ -25,24 +104,174 @@ class LLMClient:
             api_key: Anthropic API key (default: from settings)
             model: Model to use (default: from constants)
         """
-        self.api_key = api_key or settings.anthropic_api_key
+        self.api_key = api_key or anthropic_api_key()
         self.model = model or ANTHROPIC_MODEL
-        self.client = Anthropic(api_key=self.api_key)
 
+        # One client pair per API key; each call goes to the key with
+        # the fewest requests in flight, so a pool of N keys lifts the
+        # effective rate limit roughly N-fold for batch runs
+        keys = self._resolve_api_keys(api_key)
+        self._clients = [
+            Anthropic(
+                api_key=key,
+                http_client=httpx.Client(timeout=_HTTP_TIMEOUT, limits=_HTTP_LIMITS)
+            )
+            for key in keys
+        ]
+        self._async_clients = [
+            AsyncAnthropic(
+                api_key=key,
+                http_client=httpx.AsyncClient(timeout=_HTTP_TIMEOUT, limits=_HTTP_LIMITS)
+            )
+            for key in keys
+        ]
+        self._in_flight = [0] * len(keys)
+        self._pool_lock = threading.Lock()
+
+        # Single-key call sites keep working against the first entry
+        self.client = self._clients[0]
+        self.async_client = self._async_clients[0]
+
+    @staticmethod
+    def _resolve_api_keys(api_key: Optional[str]) -> list[str]:
+        """Resolve the API key pool.
+
+        An explicit key wins; otherwise the optional comma-separated
+        ANTHROPIC_API_KEYS pool is used, falling back to the single
+        configured key.
+
+        Args:
+            api_key: Key passed to the constructor, if any
+
+        Returns:
+            Non-empty list of API keys
+        """
+        if api_key:
+            return [api_key]
+        key_pool = anthropic_api_keys()
+        if key_pool:
+            keys = [key.strip() for key in key_pool.split(",") if key.strip()]
+            if keys:
+                return keys
+        return [anthropic_api_key()]
+
+    def _acquire_slot(self) -> int:
+        """Pick the client with the fewest in-flight requests."""
+        with self._pool_lock:
+            index = min(
+                range(len(self._in_flight)), key=self._in_flight.__getitem__
+            )
+            self._in_flight[index] += 1
+            return index
+
+    def _release_slot(self, index: int) -> None:
+        """Mark a request on the given client as finished."""
+        with self._pool_lock:
+            self._in_flight[index] -= 1
+
+    def _build_request(
+        self,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        system_prompt: Optional[str],
+        static_prefix: Optional[str],
+        model_override: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build the messages.create kwargs shared by sync and async calls.
+
+        Args:
+            prompt: User prompt
+            temperature: Temperature for sampling
+            max_tokens: Maximum tokens in response
+            system_prompt: Optional system prompt
+            static_prefix: Optional cacheable static content
+
+        Returns:
+            Keyword arguments for messages.create
+        """
+        # A static prefix goes first with cache_control so the prefill
+        # for it is cached across calls
+        if static_prefix:
+            content = [
+                {
+                    "type": "text",
+                    "text": static_prefix,
+                    "cache_control": {"type": "ephemeral"}
+                },
+                {"type": "text", "text": prompt}
+            ]
+        else:
+            content = prompt
+
+        kwargs = {
+            "model": model_override or self.model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "messages": [{"role": "user", "content": content}]
+        }
+
+        # Only add system if provided
+        if system_prompt:
+            kwargs["system"] = system_prompt
+
+        return kwargs
+
+    @staticmethod
+    def _parse_json_text(response_text: str) -> Dict[str, Any]:
+        """Parse a JSON response, stripping markdown code fences if present.
+
+        Args:
+            response_text: Raw model output
+
+        Returns:
+            Parsed JSON object
+
+        Raises:
+            json.JSONDecodeError: If response is not valid JSON
+        """
+        try:
+            body = _JSON_FENCE.match(response_text).group(1)
+
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, so
+            # the except clause below covers both decoders
+            if orjson is not None:
+                return orjson.loads(body)
+            return json.loads(body)
+
+        except json.JSONDecodeError as e:
+            logger.error("Failed to parse JSON response: %s", e)
+            logger.error("Response text: %s", response_text[:500])
+            raise
+
+    @retry_with_backoff(
+        max_retries=4,
+        base_delay=1.0,
+        max_delay=30.0,
+        exceptions=_RETRYABLE_EXCEPTIONS
+    )
     def call(
         self,
         prompt: str,
         temperature: float = TEMPERATURE,
         max_tokens: int = MAX_TOKENS_PER_STEP,
-        system_prompt: Optional[str] = None
+        system_prompt: Optional[str] = None,
+        static_prefix: Optional[str] = None,
+        model_override: Optional[str] = None
     ) -> tuple[str, int, int]:
         """Call Claude API with a prompt.
 
+        Transient failures (429s, timeouts, connection drops, 5xx) are
+        retried with exponential backoff and jitter before surfacing.
+
         Args:
             prompt: User prompt
             temperature: Temperature for sampling (0.0-1.0)
             max_tokens: Maximum tokens in response
             system_prompt: Optional system prompt
+            static_prefix: Optional static content sent before the prompt
+                and marked with cache_control, so identical prefixes are
+                served from Anthropic's prompt cache across calls
 
         Returns:
             Tuple of (response_text, input_tokens, output_tokens)
@@ -51,31 +280,103 @@ class LLMClient:
             Exception: If API call fails
         """
         try:
-            logger.info(f"Calling Claude API (model: {self.model})")
+            logger.info("Calling Claude API (model: %s)", self.model)
 
-            # Build messages
-            messages = [{"role": "user", "content": prompt}]
+            kwargs = self._build_request(
+                prompt, temperature, max_tokens, system_prompt, static_prefix,
+                model_override=model_override
+            )
+            # Stream instead of blocking on the full response: chunks
+            # are scanned as they land, and once the top-level JSON
+            # value closes there is nothing left worth buffering
+            scanner = _JsonStreamScanner()
+            chunks: list[str] = []
+
+            index = self._acquire_slot()
+            try:
+                with self._clients[index].messages.stream(**kwargs) as stream:
+                    for chunk in stream.text_stream:
+                        chunks.append(chunk)
+                        if scanner.feed(chunk):
+                            break
+                    message = stream.get_final_message()
+            finally:
+                self._release_slot(index)
+
+            response_text = "".join(chunks)
 
-            # Make API call
-            kwargs = {
-                "model": self.model,
-                "max_tokens": max_tokens,
-                "temperature": temperature,
-                "messages": messages
-            }
+            # Get token usage
+            input_tokens = message.usage.input_tokens
+            output_tokens = message.usage.output_tokens
 
-            # Only add system if provided
-            if system_prompt:
-                kwargs["system"] = system_prompt
+            logger.info(
+                f"Claude API call successful. "
+                f"Tokens: {input_tokens} in, {output_tokens} out"
+            )
 
-            response = self.client.messages.create(**kwargs)
+            return response_text, input_tokens, output_tokens
 
-            # Extract response text
-            response_text = response.content[0].text
+        except Exception as e:
+            logger.error("Claude API call failed: %s", e)
+            raise
 
-            # Get token usage
-            input_tokens = response.usage.input_tokens
-            output_tokens = response.usage.output_tokens
+    @retry_async_with_backoff(
+        max_retries=4,
+        base_delay=1.0,
+        max_delay=30.0,
+        exceptions=_RETRYABLE_EXCEPTIONS
+    )
+    async def acall(
+        self,
+        prompt: str,
+        temperature: float = TEMPERATURE,
+        max_tokens: int = MAX_TOKENS_PER_STEP,
+        system_prompt: Optional[str] = None,
+        static_prefix: Optional[str] = None,
+        model_override: Optional[str] = None
+    ) -> tuple[str, int, int]:
+        """Async variant of call() for concurrent article processing.
+
+        Retries transient failures with backoff + jitter like call().
+
+        Args:
+            prompt: User prompt
+            temperature: Temperature for sampling (0.0-1.0)
+            max_tokens: Maximum tokens in response
+            system_prompt: Optional system prompt
+            static_prefix: Optional cacheable static content (see call())
+
+        Returns:
+            Tuple of (response_text, input_tokens, output_tokens)
+
+        Raises:
+            Exception: If API call fails
+        """
+        try:
+            logger.info("Calling Claude API async (model: %s)", self.model)
+
+            kwargs = self._build_request(
+                prompt, temperature, max_tokens, system_prompt, static_prefix,
+                model_override=model_override
+            )
+            # Same streamed JSON scan as call()
+            scanner = _JsonStreamScanner()
+            chunks: list[str] = []
+
+            index = self._acquire_slot()
+            try:
+                async with self._async_clients[index].messages.stream(**kwargs) as stream:
+                    async for chunk in stream.text_stream:
+                        chunks.append(chunk)
+                        if scanner.feed(chunk):
+                            break
+                    message = await stream.get_final_message()
+            finally:
+                self._release_slot(index)
+
+            response_text = "".join(chunks)
+            input_tokens = message.usage.input_tokens
+            output_tokens = message.usage.output_tokens
 
             logger.info(
                 f"Claude API call successful. "
@@ -85,7 +386,7 @@ class LLMClient:
             return response_text, input_tokens, output_tokens
 
         except Exception as e:
-            logger.error(f"Claude API call failed: {e}")
+            logger.error("Claude API call failed: %s", e)
             raise
 
     def call_with_json_response(
@@ -93,7 +394,9 @@ class LLMClient:
         prompt: str,
         temperature: float = TEMPERATURE,
         max_tokens: int = MAX_TOKENS_PER_STEP,
-        system_prompt: Optional[str] = None
+        system_prompt: Optional[str] = None,
+        static_prefix: Optional[str] = None,
+        model_override: Optional[str] = None
     ) -> tuple[Dict[str, Any], int, int]:
         """Call Claude API and parse JSON response.
 
@@ -102,6 +405,8 @@ class LLMClient:
             temperature: Temperature for sampling
             max_tokens: Maximum tokens in response
             system_prompt: Optional system prompt
+            static_prefix: Optional cacheable static content sent before
+                the prompt (see call())
 
         Returns:
             Tuple of (parsed_json_dict, input_tokens, output_tokens)
@@ -114,34 +419,48 @@ class LLMClient:
             prompt=prompt,
             temperature=temperature,
             max_tokens=max_tokens,
-            system_prompt=system_prompt
+            system_prompt=system_prompt,
+            static_prefix=static_prefix,
+            model_override=model_override
         )
 
-        # Try to parse JSON
-        try:
-            # Claude sometimes wraps JSON in markdown code blocks
-            response_text = response_text.strip()
-
-            # Remove markdown code blocks if present
-            if response_text.startswith("```json"):
-                response_text = response_text[7:]  # Remove ```json
-            elif response_text.startswith("```"):
-                response_text = response_text[3:]  # Remove ```
+        return self._parse_json_text(response_text), input_tokens, output_tokens
 
-            if response_text.endswith("```"):
-                response_text = response_text[:-3]  # Remove trailing ```
+    async def acall_with_json_response(
+        self,
+        prompt: str,
+        temperature: float = TEMPERATURE,
+        max_tokens: int = MAX_TOKENS_PER_STEP,
+        system_prompt: Optional[str] = None,
+        static_prefix: Optional[str] = None,
+        model_override: Optional[str] = None
+    ) -> tuple[Dict[str, Any], int, int]:
+        """Async variant of call_with_json_response().
 
-            response_text = response_text.strip()
+        Args:
+            prompt: User prompt (should request JSON output)
+            temperature: Temperature for sampling
+            max_tokens: Maximum tokens in response
+            system_prompt: Optional system prompt
+            static_prefix: Optional cacheable static content (see call())
 
-            # Parse JSON
-            parsed_json = json.loads(response_text)
+        Returns:
+            Tuple of (parsed_json_dict, input_tokens, output_tokens)
 
-            return parsed_json, input_tokens, output_tokens
+        Raises:
+            json.JSONDecodeError: If response is not valid JSON
+            Exception: If API call fails
+        """
+        response_text, input_tokens, output_tokens = await self.acall(
+            prompt=prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            system_prompt=system_prompt,
+            static_prefix=static_prefix,
+            model_override=model_override
+        )
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON response: {e}")
-            logger.error(f"Response text: {response_text[:500]}")
-            raise
+        return self._parse_json_text(response_text), input_tokens, output_tokens
 
 
 class MockLLMClient:
@@ -156,7 +475,9 @@ class MockLLMClient:
         prompt: str,
         temperature: float = TEMPERATURE,
         max_tokens: int = MAX_TOKENS_PER_STEP,
-        system_prompt: Optional[str] = None
+        system_prompt: Optional[str] = None,
+        static_prefix: Optional[str] = None,
+        model_override: Optional[str] = None
     ) -> tuple[str, int, int]:
         """Return mock response.
 
@@ -165,6 +486,7 @@ class MockLLMClient:
             temperature: Temperature (ignored)
             max_tokens: Max tokens (ignored)
             system_prompt: System prompt (ignored)
+            static_prefix: Static prefix (ignored)
 
         Returns:
             Tuple of (mock_response, mock_input_tokens, mock_output_tokens)
@@ -177,7 +499,9 @@ class MockLLMClient:
         prompt: str,
         temperature: float = TEMPERATURE,
         max_tokens: int = MAX_TOKENS_PER_STEP,
-        system_prompt: Optional[str] = None
+        system_prompt: Optional[str] = None,
+        static_prefix: Optional[str] = None,
+        model_override: Optional[str] = None
     ) -> tuple[Dict[str, Any], int, int]:
         """Return mock JSON response.
 
@@ -186,6 +510,7 @@ class MockLLMClient:
             temperature: Temperature (ignored)
             max_tokens: Max tokens (ignored)
             system_prompt: System prompt (ignored)
+            static_prefix: Static prefix (ignored)
 
         Returns:
             Tuple of (mock_json_dict, mock_input_tokens, mock_output_tokens)
@@ -196,16 +521,47 @@ class MockLLMClient:
         }
         return mock_json, 100, 50
 
+    async def acall(
+        self,
+        prompt: str,
+        temperature: float = TEMPERATURE,
+        max_tokens: int = MAX_TOKENS_PER_STEP,
+        system_prompt: Optional[str] = None,
+        static_prefix: Optional[str] = None,
+        model_override: Optional[str] = None
+    ) -> tuple[str, int, int]:
+        """Async variant of call(); returns the same mock response."""
+        return self.call(prompt, temperature, max_tokens, system_prompt, static_prefix)
+
+    async def acall_with_json_response(
+        self,
+        prompt: str,
+        temperature: float = TEMPERATURE,
+        max_tokens: int = MAX_TOKENS_PER_STEP,
+        system_prompt: Optional[str] = None,
+        static_prefix: Optional[str] = None,
+        model_override: Optional[str] = None
+    ) -> tuple[Dict[str, Any], int, int]:
+        """Async variant of call_with_json_response(); same mock JSON."""
+        return self.call_with_json_response(
+            prompt, temperature, max_tokens, system_prompt, static_prefix
+        )
 
+
+@lru_cache(maxsize=None)
 def get_llm_client(mock: bool = False) -> LLMClient | MockLLMClient:
     """Factory function to get LLM client.
 
+    Cached per mock flag: ChainExecutor and DailyAnalyzer share one
+    client (and its warm HTTP pools) instead of re-allocating TLS
+    state per component.
+
     Args:
         mock: Whether to use mock client
 
     Returns:
         LLMClient or MockLLMClient
     """
-    if mock or settings.mock_llm:
+    if mock or mock_llm():
         return MockLLMClient()
     return LLMClient()
@@ -28,17 +28,17 @@ class BaseScraper(ABC):
         """
         pass
 
-    def log_info(self, message: str):
-        """Log info message."""
-        self.logger.info(f"[{self.__class__.__name__}] {message}")
+    def log_info(self, message: str, *args):
+        """Log info message (args are deferred %-style format values)."""
+        self.logger.info(f"[{self.__class__.__name__}] {message}", *args)
 
-    def log_warning(self, message: str):
-        """Log warning message."""
-        self.logger.warning(f"[{self.__class__.__name__}] {message}")
+    def log_warning(self, message: str, *args):
+        """Log warning message (args are deferred %-style format values)."""
+        self.logger.warning(f"[{self.__class__.__name__}] {message}", *args)
 
-    def log_error(self, message: str):
-        """Log error message."""
-        self.logger.error(f"[{self.__class__.__name__}] {message}")
+    def log_error(self, message: str, *args):
+        """Log error message (args are deferred %-style format values)."""
+        self.logger.error(f"[{self.__class__.__name__}] {message}", *args)
 
 
 class ScraperError(Exception):
@@ -1,11 +1,23 @@
 """Market data scrapers for Yahoo Finance and Google Finance."""
 
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
 from typing import List, Dict, Optional
+import json
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 import yfinance as yf
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 from src.scrapers.base import BaseScraper, ScraperError
 from src.models.schemas import MarketIndicator, MarketSnapshot
 from src.models.enums import MarketTier
@@ -16,10 +28,34 @@ from src.config.constants import (
     CONTEXT_INDICATORS
 )
 
+logger = logging.getLogger(__name__)
+
+# Shared session for the Yahoo quote endpoint: one pooled TCP/TLS
+# connection serves every snapshot instead of handshaking per run
+_yahoo_quote_session = requests.Session()
+_yahoo_quote_session.mount("https://", HTTPAdapter(pool_connections=16))
+
+_YAHOO_QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote"
+
+
+def _loads(payload: bytes) -> dict:
+    """Decode a JSON payload with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
 
 class YahooFinanceMarketScraper(BaseScraper):
     """Scraper for market data from Yahoo Finance."""
 
+    HEADERS = {
+        "User-Agent": (
+            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+            "AppleWebKit/537.36 (KHTML, like Gecko) "
+            "Chrome/120.0.0.0 Safari/537.36"
+        )
+    }
+
     # Indicator configuration with symbols and tiers
     INDICATORS_CONFIG = {
         # Critical indicators
@@ -43,38 +79,132 @@ class YahooFinanceMarketScraper(BaseScraper):
         "eur_usd": {"symbol": "EURUSD=X", "tier": MarketTier.CONTEXT},
     }
 
-    def _fetch_single_indicator(
+    def _fetch_all_quotes_batch(self, symbols: List[str]) -> Dict[str, dict]:
+        """Fetch last price and previous close for all symbols in one request.
+
+        Hits the Yahoo quote endpoint directly instead of going through
+        yfinance: one HTTP round-trip for every symbol and a plain JSON
+        parse, with no per-ticker pandas DataFrame allocation for the two
+        fields actually used.
+
+        Args:
+            symbols: Yahoo Finance symbols
+
+        Returns:
+            Mapping of symbol to its raw quote dict
+
+        Raises:
+            ScraperError: If the endpoint cannot be fetched or parsed
+        """
+        try:
+            response = _yahoo_quote_session.get(
+                _YAHOO_QUOTE_URL,
+                params={"symbols": ",".join(symbols)},
+                headers=self.HEADERS,
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            results = _loads(response.content)["quoteResponse"]["result"]
+            return {quote["symbol"]: quote for quote in results}
+        except (requests.RequestException, ValueError, KeyError) as e:
+            raise ScraperError(f"Quote endpoint failed: {e}")
+
+    def _indicator_from_quote(
         self,
         name: str,
         symbol: str,
-        tier: MarketTier
+        tier: MarketTier,
+        quote: Optional[dict],
+        timestamp: datetime
     ) -> MarketIndicator:
-        """Fetch data for a single market indicator.
+        """Build a MarketIndicator from a raw quote-endpoint entry.
 
         Args:
             name: Indicator name
             symbol: Yahoo Finance symbol
             tier: Market tier classification
+            quote: Raw quote dict (None when the symbol was not returned)
+            timestamp: Shared snapshot timestamp
 
         Returns:
-            MarketIndicator object
+            MarketIndicator object (with error set on failure)
+        """
+        if quote is None or quote.get("regularMarketPrice") is None:
+            return MarketIndicator(
+                name=name,
+                symbol=symbol,
+                tier=tier,
+                timestamp=timestamp,
+                error="No price data available"
+            )
+
+        price = float(quote["regularMarketPrice"])
+        prev_close = quote.get("regularMarketPreviousClose")
+        prev_close = float(prev_close) if prev_close is not None else None
+
+        # Calculate changes
+        change_value = None
+        change_pct = None
+
+        if prev_close and prev_close > 0:
+            change_value = price - prev_close
+            change_pct = (change_value / prev_close) * 100
+
+        return MarketIndicator(
+            name=name,
+            symbol=symbol,
+            value=round(price, 4),
+            previous_close=round(prev_close, 4) if prev_close else None,
+            change_value=round(change_value, 4) if change_value else None,
+            change_pct=round(change_pct, 2) if change_pct else None,
+            tier=tier,
+            timestamp=timestamp,
+            error=None
+        )
+
+    def _indicator_from_batch(
+        self,
+        name: str,
+        symbol: str,
+        tier: MarketTier,
+        batch_df,
+        timestamp: datetime
+    ) -> MarketIndicator:
+        """Build a MarketIndicator from the batch download frame.
+
+        Args:
+            name: Indicator name
+            symbol: Yahoo Finance symbol
+            tier: Market tier classification
+            batch_df: Frame returned by yf.download (None if it failed)
+            timestamp: Shared snapshot timestamp
+
+        Returns:
+            MarketIndicator object (with error set on failure)
         """
         try:
-            ticker = yf.Ticker(symbol)
-            info = ticker.fast_info
+            if batch_df is None:
+                raise ScraperError("Batch download failed")
 
-            price = info.last_price
-            prev_close = info.previous_close
+            # Multi-ticker downloads group columns by symbol; a
+            # single-ticker frame comes back flat
+            try:
+                closes = batch_df[symbol]["Close"].dropna()
+            except KeyError:
+                closes = batch_df["Close"].dropna()
 
-            if price is None:
+            if closes.empty:
                 return MarketIndicator(
                     name=name,
                     symbol=symbol,
                     tier=tier,
-                    timestamp=datetime.now(),
+                    timestamp=timestamp,
                     error="No price data available"
                 )
 
+            price = float(closes.iloc[-1])
+            prev_close = float(closes.iloc[-2]) if len(closes) > 1 else None
+
             # Calculate changes
             change_value = None
             change_pct = None
@@ -91,17 +221,17 @@ class YahooFinanceMarketScraper(BaseScraper):
                 change_value=round(change_value, 4) if change_value else None,
                 change_pct=round(change_pct, 2) if change_pct else None,
                 tier=tier,
-                timestamp=datetime.now(),
+                timestamp=timestamp,
                 error=None
             )
 
         except Exception as e:
-            self.log_error(f"Error fetching {name} ({symbol}): {e}")
+            self.log_error("Error fetching %s (%s): %s", name, symbol, e)
             return MarketIndicator(
                 name=name,
                 symbol=symbol,
                 tier=tier,
-                timestamp=datetime.now(),
+                timestamp=timestamp,
                 error=str(e)
             )
 
@@ -125,19 +255,52 @@ class YahooFinanceMarketScraper(BaseScraper):
                 if k in indicators
             }
 
-        # Fetch all indicators
-        scraped_indicators = {}
+        # One request for every symbol instead of a serial HTTP
+        # round-trip per indicator
+        symbols = [config['symbol'] for config in indicators_to_scrape.values()]
+        self.log_info("Fetching %d indicators in one batch", len(symbols))
 
-        for name, config in indicators_to_scrape.items():
-            self.log_info(f"Fetching {name} ({config['symbol']})")
+        timestamp = datetime.now()
 
-            indicator = self._fetch_single_indicator(
-                name=name,
-                symbol=config['symbol'],
-                tier=config['tier']
-            )
+        try:
+            quotes = self._fetch_all_quotes_batch(symbols)
+            scraped_indicators = {
+                name: self._indicator_from_quote(
+                    name=name,
+                    symbol=config['symbol'],
+                    tier=config['tier'],
+                    quote=quotes.get(config['symbol']),
+                    timestamp=timestamp
+                )
+                for name, config in indicators_to_scrape.items()
+            }
+        except ScraperError as e:
+            # Fall back to the yfinance batch download when the quote
+            # endpoint is unavailable (rate limits, schema changes)
+            self.log_error("%s; falling back to yfinance batch download", e)
+            try:
+                batch_df = yf.download(
+                    tickers=symbols,
+                    period="2d",
+                    interval="1d",
+                    group_by="ticker",
+                    threads=True,
+                    progress=False
+                )
+            except Exception as download_error:
+                self.log_error("Batch download failed: %s", download_error)
+                batch_df = None
 
-            scraped_indicators[name] = indicator
+            scraped_indicators = {
+                name: self._indicator_from_batch(
+                    name=name,
+                    symbol=config['symbol'],
+                    tier=config['tier'],
+                    batch_df=batch_df,
+                    timestamp=timestamp
+                )
+                for name, config in indicators_to_scrape.items()
+            }
 
         # Create snapshot
         snapshot = MarketSnapshot(
@@ -146,7 +309,7 @@ class YahooFinanceMarketScraper(BaseScraper):
         )
 
         valid_count = len([i for i in scraped_indicators.values() if i.error is None])
-        self.log_info(f"Successfully scraped {valid_count}/{len(scraped_indicators)} indicators")
+        self.log_info("Successfully scraped %d/%d indicators", valid_count, len(scraped_indicators))
 
         return snapshot
 
@@ -163,6 +326,11 @@ class YahooFinanceMarketScraper(BaseScraper):
         return self.scrape(indicators=critical_names)
 
 
+# Shared session reuses the TCP/TLS connection to google.com/finance
+# across exchange-rate fetches instead of handshaking per request
+_google_finance_session = requests.Session()
+
+
 class GoogleFinanceExchangeScraper(BaseScraper):
     """Scraper for exchange rates from Google Finance."""
 
@@ -193,13 +361,14 @@ class GoogleFinanceExchangeScraper(BaseScraper):
             ScraperError: If page cannot be fetched
         """
         try:
-            response = requests.get(
+            response = _google_finance_session.get(
                 url,
                 headers=self.HEADERS,
                 timeout=self.timeout
             )
             response.raise_for_status()
-            return BeautifulSoup(response.content, 'html.parser')
+            # lxml parses in C; html.parser walks the DOM in pure Python
+            return BeautifulSoup(response.content, 'lxml')
 
         except requests.RequestException as e:
             raise ScraperError(f"Error fetching page {url}: {e}")
@@ -242,7 +411,7 @@ class GoogleFinanceExchangeScraper(BaseScraper):
             raise ValueError(f"Unknown exchange pair: {pair}")
 
         url = self.EXCHANGE_RATES[pair]
-        self.log_info(f"Scraping {pair} from Google Finance")
+        self.log_info("Scraping %s from Google Finance", pair)
 
         try:
             soup = self._fetch_page(url)
@@ -258,7 +427,7 @@ class GoogleFinanceExchangeScraper(BaseScraper):
             )
 
         except (ScraperError, Exception) as e:
-            self.log_error(f"Failed to scrape {pair}: {e}")
+            self.log_error("Failed to scrape %s: %s", pair, e)
             return MarketIndicator(
                 name=pair,
                 symbol=pair.upper().replace("_", "/"),
@@ -268,44 +437,99 @@ class GoogleFinanceExchangeScraper(BaseScraper):
             )
 
     def scrape(self) -> Dict[str, MarketIndicator]:
-        """Scrape all configured exchange rates.
+        """Scrape all configured exchange rates concurrently.
+
+        Each pair is an independent HTTP fetch, so wall time equals the
+        slowest single page rather than the sum.
 
         Returns:
             Dictionary of MarketIndicator objects
         """
         self.log_info("Starting exchange rate scrape from Google Finance")
 
-        indicators = {}
+        pairs = list(self.EXCHANGE_RATES.keys())
+        with ThreadPoolExecutor(max_workers=min(8, len(pairs))) as executor:
+            results = executor.map(self.scrape_exchange_rate, pairs)
+
+        return dict(zip(pairs, results))
+
+
+# Quotes barely move within a few minutes; re-runs inside the TTL
+# reuse the last snapshot instead of re-hitting Yahoo/Google
+_SNAPSHOT_TTL_SECONDS = 300
 
-        for pair in self.EXCHANGE_RATES.keys():
-            indicator = self.scrape_exchange_rate(pair)
-            indicators[pair] = indicator
 
-        return indicators
+def _snapshot_cache_path(include_google_finance: bool) -> Path:
+    """Path of the on-disk snapshot cache for the given source set."""
+    from src.config.settings import settings
+    suffix = "full" if include_google_finance else "yahoo"
+    return settings.cache_dir / "market" / f"snapshot_{suffix}.json"
 
 
-def scrape_market_data(include_google_finance: bool = False) -> MarketSnapshot:
+def _load_cached_snapshot(path: Path) -> Optional[MarketSnapshot]:
+    """Load a snapshot from disk if it exists and is within the TTL."""
+    try:
+        if time.time() - path.stat().st_mtime > _SNAPSHOT_TTL_SECONDS:
+            return None
+        return MarketSnapshot.model_validate_json(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _store_cached_snapshot(path: Path, snapshot: MarketSnapshot) -> None:
+    """Store a snapshot atomically (temp file, then rename)."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(snapshot.model_dump_json(), encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning("Failed to cache market snapshot: %s", e)
+
+
+def scrape_market_data(
+    include_google_finance: bool = False,
+    use_cache: bool = True
+) -> MarketSnapshot:
     """Helper function to scrape all market data.
 
     Args:
         include_google_finance: Whether to include Google Finance data
+        use_cache: Reuse a snapshot scraped within the last 5 minutes
 
     Returns:
         MarketSnapshot with all indicators
     """
-    # Scrape Yahoo Finance data
+    cache_path = _snapshot_cache_path(include_google_finance)
+
+    if use_cache:
+        cached = _load_cached_snapshot(cache_path)
+        if cached is not None:
+            logger.info("Using cached market snapshot from %s", cache_path)
+            return cached
+
     yahoo_scraper = YahooFinanceMarketScraper()
-    snapshot = yahoo_scraper.scrape()
 
-    # Optionally add Google Finance data (for comparison)
-    if include_google_finance:
-        google_scraper = GoogleFinanceExchangeScraper()
-        google_indicators = google_scraper.scrape()
+    if not include_google_finance:
+        snapshot = yahoo_scraper.scrape()
+        _store_cached_snapshot(cache_path, snapshot)
+        return snapshot
+
+    # Yahoo and Google hit unrelated hosts, so run them as two
+    # overlapping futures instead of back to back
+    google_scraper = GoogleFinanceExchangeScraper()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        yahoo_future = executor.submit(yahoo_scraper.scrape)
+        google_future = executor.submit(google_scraper.scrape)
+
+        snapshot = yahoo_future.result()
+        google_indicators = google_future.result()
 
-        # Add with prefix to avoid conflicts
-        for name, indicator in google_indicators.items():
-            snapshot.indicators[f"google_{name}"] = indicator
+    # Add with prefix to avoid conflicts
+    for name, indicator in google_indicators.items():
+        snapshot.indicators[f"google_{name}"] = indicator
 
+    _store_cached_snapshot(cache_path, snapshot)
     return snapshot
 
 
@@ -1,17 +1,72 @@
 """Local Parquet storage with date partitioning."""
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.fs as pafs
+import pyarrow.parquet as pq
 from pathlib import Path
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 import logging
 
-from src.models.schemas import RawNews, MarketSnapshot, GateCheckResult, ProcessedNews
-from src.config.constants import PARQUET_COMPRESSION
+from src.models.schemas import (
+    RawNews, MarketSnapshot, GateCheckResult, ProcessedNews
+)
+from src.models.rows import processed_news_to_row, row_to_record
+from src.config.constants import PARQUET_COMPRESSION, PARQUET_COMPRESSION_LEVEL
+from src.utils.bloom import BloomFilter
 from src.utils.date_utils import get_date_partition
 
 logger = logging.getLogger(__name__)
 
+# mmap-backed reads give Arrow zero-copy buffers over the kernel page
+# cache: repeated scans of the same partition within a scrape session
+# (hash_exists, find_similar_titles) reuse cached pages instead of
+# copying file bytes into fresh process buffers each time
+_LOCAL_MMAP_FS = pafs.LocalFileSystem(use_mmap=True)
+
+
+def _raw_news_to_dict(article: RawNews) -> Dict[str, Any]:
+    """Extract the persisted RawNews fields as a plain dict.
+
+    Direct attribute access instead of model_dump(): the field set is
+    fixed, so there is no need to walk the pydantic schema per article.
+    Keys mirror what model_dump produced so existing files and readers
+    see the same columns.
+    """
+    return {
+        "article_id": article.article_id,
+        "url": article.url,
+        "title": article.title,
+        "content": article.content,
+        "scraped_at": article.scraped_at,
+        "source": article.source,
+        "content_length": article.content_length,
+        "hash_content": article.hash_content,
+        "title_simhash": article.title_simhash,
+        "date_partition": article.date_partition,
+    }
+
+
+# Arrow schema for raw-news rows (mirrors _raw_news_to_dict). Declared
+# explicitly because inference from sample rows types title_simhash as
+# int64, and simhash64 yields unsigned 64-bit values — anything >= 2^63
+# would overflow on write
+RAW_NEWS_SCHEMA = pa.schema([
+    ("article_id", pa.string()),
+    ("url", pa.string()),
+    ("title", pa.string()),
+    ("content", pa.string()),
+    ("scraped_at", pa.timestamp("us")),
+    ("source", pa.string()),
+    ("content_length", pa.int64()),
+    ("hash_content", pa.string()),
+    ("title_simhash", pa.uint64()),
+    ("date_partition", pa.string()),
+])
+
 
 class ParquetStorage:
     """Handler for reading/writing Parquet files with date partitioning."""
@@ -60,6 +115,51 @@ class ParquetStorage:
         timestamp = date.strftime("%Y%m%d_%H%M%S")
         return f"{prefix}_{timestamp}.parquet"
 
+    # Rows per row group: a day's scrape fits in a single group (small
+    # footer, one set of page headers, best compression), while backfills
+    # above the cap still stream in bounded chunks. Many tiny row groups
+    # is the pathological case for both write and read throughput.
+    _MAX_ROW_GROUP_ROWS = 128_000
+
+    @classmethod
+    def _stream_write(
+        cls,
+        records: List[Dict[str, Any]],
+        filepath: Path,
+        schema: Optional[pa.Schema] = None,
+        batch_size: Optional[int] = None
+    ) -> None:
+        """Stream records to one Parquet file in chunked row groups.
+
+        Only one chunk's Arrow buffers are alive at a time, so peak
+        memory is bounded by batch_size rows instead of the record list
+        plus a full table existing at once.
+
+        Args:
+            records: Row dicts to write
+            filepath: Destination Parquet file
+            schema: Arrow schema (inferred from the first chunk if None)
+            batch_size: Rows per row group (default: one group up to
+                _MAX_ROW_GROUP_ROWS)
+        """
+        if batch_size is None:
+            batch_size = min(len(records), cls._MAX_ROW_GROUP_ROWS)
+
+        if schema is None:
+            schema = pa.Table.from_pylist(records[:batch_size]).schema
+
+        with pq.ParquetWriter(
+            filepath,
+            schema,
+            compression=PARQUET_COMPRESSION,
+            compression_level=PARQUET_COMPRESSION_LEVEL,
+            use_dictionary=True
+        ) as writer:
+            for start in range(0, len(records), batch_size):
+                writer.write_batch(pa.RecordBatch.from_pylist(
+                    records[start:start + batch_size], schema=schema
+                ))
+
     def write_raw_news(
         self,
         articles: List[RawNews],
@@ -78,25 +178,45 @@ class ParquetStorage:
             logger.warning("No articles to write")
             return None
 
-        # Convert to DataFrame
-        df = pd.DataFrame([article.model_dump() for article in articles])
+        records = [_raw_news_to_dict(article) for article in articles]
 
         # Get partition path and filename
         partition_path = self._get_partition_path("news", date)
         filename = self._get_filename("news_raw", date)
         filepath = partition_path / filename
 
-        # Write Parquet
-        df.to_parquet(
-            filepath,
-            engine='pyarrow',
-            compression=PARQUET_COMPRESSION,
-            index=False
-        )
+        # Write Parquet in chunked row groups against the explicit
+        # schema (inference would overflow on uint64 simhashes)
+        self._stream_write(records, filepath, schema=RAW_NEWS_SCHEMA)
 
-        logger.info(f"Wrote {len(articles)} articles to {filepath}")
+        # Keep the partition's hash Bloom filter in sync so later
+        # hash_exists calls can rule out unseen hashes without any I/O
+        self._update_hash_bloom(partition_path, articles)
+
+        logger.info("Wrote %d articles to %s", len(articles), filepath)
         return filepath
 
+    @staticmethod
+    def _bloom_path(partition_path: Path) -> Path:
+        """Path of the sidecar hash Bloom filter for a partition."""
+        return partition_path / "_bloom.bin"
+
+    def _update_hash_bloom(
+        self,
+        partition_path: Path,
+        articles: List[RawNews]
+    ) -> None:
+        """Add the articles' content hashes to the partition's filter."""
+        try:
+            path = self._bloom_path(partition_path)
+            bloom = BloomFilter.load(path) or BloomFilter()
+            for article in articles:
+                if article.hash_content:
+                    bloom.add(article.hash_content)
+            bloom.save(path)
+        except OSError as e:
+            logger.warning("Failed to update hash bloom filter: %s", e)
+
     def write_market_snapshot(
         self,
         snapshot: MarketSnapshot,
@@ -123,23 +243,15 @@ class ParquetStorage:
             logger.warning("No market indicators to write")
             return None
 
-        # Convert to DataFrame
-        df = pd.DataFrame(records)
-
         # Get partition path and filename
         partition_path = self._get_partition_path("market", date)
         filename = self._get_filename("market_snapshot", date)
         filepath = partition_path / filename
 
-        # Write Parquet
-        df.to_parquet(
-            filepath,
-            engine='pyarrow',
-            compression=PARQUET_COMPRESSION,
-            index=False
-        )
+        # Write Parquet in chunked row groups
+        self._stream_write(records, filepath)
 
-        logger.info(f"Wrote {len(records)} indicators to {filepath}")
+        logger.info("Wrote %d indicators to %s", len(records), filepath)
         return filepath
 
     def write_gate_checks(
@@ -160,8 +272,7 @@ class ParquetStorage:
             logger.warning("No gate results to write")
             return None
 
-        # Convert to DataFrame
-        df = pd.DataFrame([result.model_dump() for result in gate_results])
+        records = [result.model_dump() for result in gate_results]
 
         # Get partition path and filename
         # Use base_dir's parent to go to data/, then gates/
@@ -175,15 +286,10 @@ class ParquetStorage:
         filename = self._get_filename("gate_checks", date)
         filepath = partition_path / filename
 
-        # Write Parquet
-        df.to_parquet(
-            filepath,
-            engine='pyarrow',
-            compression=PARQUET_COMPRESSION,
-            index=False
-        )
+        # Write Parquet in chunked row groups
+        self._stream_write(records, filepath)
 
-        logger.info(f"Wrote {len(gate_results)} gate results to {filepath}")
+        logger.info("Wrote %d gate results to %s", len(gate_results), filepath)
         return filepath
 
     def write_processed_news(
@@ -204,19 +310,12 @@ class ParquetStorage:
             logger.warning("No processed articles to write")
             return None
 
-        # Convert to DataFrame, handling lists properly
-        records = []
-        for article in processed:
-            record = article.model_dump()
-            # Convert enum values to strings
-            for key, value in record.items():
-                if hasattr(value, 'value'):  # Enum
-                    record[key] = value.value
-                elif isinstance(value, list):  # List (e.g., topics)
-                    record[key] = str(value)  # Convert to string for Parquet
-            records.append(record)
-
-        df = pd.DataFrame(records)
+        # Flatten through ProcessedNewsRow: enums and lists are converted
+        # once per field instead of scanning every dumped value
+        records = [
+            row_to_record(processed_news_to_row(article))
+            for article in processed
+        ]
 
         # Get partition path and filename
         processed_dir = self.base_dir.parent / "processed" / "news"
@@ -229,17 +328,72 @@ class ParquetStorage:
         filename = self._get_filename("processed_news", date)
         filepath = partition_path / filename
 
-        # Write Parquet
-        df.to_parquet(
-            filepath,
-            engine='pyarrow',
-            compression=PARQUET_COMPRESSION,
-            index=False
-        )
+        # Write Parquet in chunked row groups against the explicit
+        # schema shared with ProcessedNewsStreamWriter
+        self._stream_write(records, filepath, schema=PROCESSED_NEWS_SCHEMA)
 
-        logger.info(f"Wrote {len(processed)} processed articles to {filepath}")
+        logger.info("Wrote %d processed articles to %s", len(processed), filepath)
         return filepath
 
+    # Columns needed to rank and render the daily summary; everything
+    # else (CoT strings, token counts, ...) is never read back. Names
+    # must match PROCESSED_NEWS_SCHEMA — rows have no title column, so
+    # renderers fall back to the summary
+    _SUMMARY_COLUMNS = [
+        "article_id", "summary", "topics",
+        "ranking_score", "ranking_category", "ranking_trader_action",
+        "impact_direction", "impact_confidence", "ranking_justification"
+    ]
+
+    def summarize_processed_news(
+        self,
+        date: Optional[datetime] = None,
+        top_n: int = 5
+    ) -> tuple[Dict[int, int], List[Dict[str, Any]], int]:
+        """Compute ranking distribution and top articles from Parquet.
+
+        Runs entirely on Arrow columnar kernels: only the summary
+        columns are read, counting and sorting happen in C, and just
+        the top rows are ever materialized as Python dicts — memory
+        stays O(top_n) instead of O(articles).
+
+        Args:
+            date: Date partition to summarize (default: today)
+            top_n: Number of top-ranked rows to materialize
+
+        Returns:
+            Tuple of (ranking distribution, top rows as dicts, total rows)
+        """
+        distribution = {score: 0 for score in range(1, 6)}
+
+        processed_dir = self.base_dir.parent / "processed" / "news"
+        partition_path = processed_dir / get_date_partition(date)
+        parquet_files = list(partition_path.glob("*.parquet"))
+
+        if not parquet_files:
+            logger.warning("No processed news found in %s", partition_path)
+            return distribution, [], 0
+
+        table = pa.concat_tables(
+            self._open_table(f, columns=self._SUMMARY_COLUMNS)
+            for f in parquet_files
+        )
+
+        for item in pc.value_counts(table.column("ranking_score")).to_pylist():
+            if item["values"] in distribution:
+                distribution[item["values"]] += item["counts"]
+
+        top_rows = table.sort_by([
+            ("ranking_score", "descending"),
+            ("impact_confidence", "descending")
+        ]).slice(0, top_n).to_pylist()
+
+        logger.info(
+            "Summarized %d processed articles from %s",
+            table.num_rows, partition_path
+        )
+        return distribution, top_rows, table.num_rows
+
     def read_raw_news(
         self,
         date: Optional[datetime] = None,
@@ -260,19 +414,81 @@ class ParquetStorage:
         parquet_files = list(partition_path.glob("*.parquet"))
 
         if not parquet_files:
-            logger.warning(f"No parquet files found in {partition_path}")
+            logger.warning("No parquet files found in %s", partition_path)
             return []
 
-        # Read and concatenate all files
-        dfs = [pd.read_parquet(f) for f in parquet_files]
-        df = pd.concat(dfs, ignore_index=True)
+        # Arrow dataset scan reads the files' row groups on parallel
+        # threads and skips the pandas copy entirely
+        table = self._open_dataset(partition_path).to_table()
 
-        # Convert to RawNews objects
-        articles = [RawNews(**row) for row in df.to_dict('records')]
+        # Rows were validated when written (hash, simhash and length are
+        # already materialized), so the round-trip skips validation with
+        # model_construct instead of re-running every validator per row
+        articles = [RawNews.model_construct(**row) for row in table.to_pylist()]
 
-        logger.info(f"Read {len(articles)} articles from {partition_path}")
+        logger.info("Read %d articles from %s", len(articles), partition_path)
         return articles
 
+    @staticmethod
+    def _open_dataset(partition_path: Path) -> ds.Dataset:
+        """Open a partition as an Arrow dataset over mmap-backed files.
+
+        Args:
+            partition_path: Partition directory to scan
+
+        Returns:
+            Parquet dataset whose reads are zero-copy memory maps
+        """
+        return ds.dataset(
+            str(partition_path), format="parquet", filesystem=_LOCAL_MMAP_FS
+        )
+
+    @staticmethod
+    def _open_table(
+        path: Path,
+        columns: Optional[List[str]] = None
+    ) -> pa.Table:
+        """Read one Parquet file through a memory map.
+
+        Args:
+            path: Parquet file to read
+            columns: Columns to project (default: all)
+
+        Returns:
+            Arrow table backed by zero-copy mmap buffers
+        """
+        with pa.memory_map(str(path), 'r') as source:
+            return pq.read_table(source, columns=columns)
+
+    def _read_column(
+        self,
+        column: str,
+        date: Optional[datetime] = None,
+        subdirectory: str = "news"
+    ) -> List[Any]:
+        """Read one column of a partition as a Python list.
+
+        Parquet's columnar layout means the other columns (notably the
+        multi-KB content strings) are never touched on disk, so a scan
+        that only needs titles or hashes moves a tiny fraction of the
+        bytes a full read_raw_news would.
+
+        Args:
+            column: Column name to project
+            date: Date partition to read (default: today)
+            subdirectory: Subdirectory to read from
+
+        Returns:
+            Column values in file order (empty if no data)
+        """
+        partition_path = self._get_partition_path(subdirectory, date)
+
+        if not any(partition_path.glob("*.parquet")):
+            return []
+
+        table = self._open_dataset(partition_path).to_table(columns=[column])
+        return table.column(column).to_pylist()
+
     def read_market_snapshot(
         self,
         date: Optional[datetime] = None
@@ -291,15 +507,15 @@ class ParquetStorage:
         parquet_files = list(partition_path.glob("*.parquet"))
 
         if not parquet_files:
-            logger.warning(f"No market snapshot found in {partition_path}")
+            logger.warning("No market snapshot found in %s", partition_path)
             return None
 
-        # Read latest file
+        # Read latest file through a memory map
         latest_file = max(parquet_files, key=lambda p: p.stat().st_mtime)
-        df = pd.read_parquet(latest_file)
+        df = self._open_table(latest_file).to_pandas()
 
         # Reconstruct MarketSnapshot (simplified - would need full reconstruction)
-        logger.info(f"Read market snapshot from {latest_file}")
+        logger.info("Read market snapshot from %s", latest_file)
         return df
 
     def hash_exists(self, content_hash: str, date: Optional[datetime] = None) -> bool:
@@ -312,12 +528,93 @@ class ParquetStorage:
         Returns:
             True if hash exists
         """
+        partition_path = self._get_partition_path("news", date)
+
+        if not any(partition_path.glob("*.parquet")):
+            return False
+
+        # Bloom sidecar first: a miss is definitive and costs k bit
+        # probes; only a (possibly false-positive) hit falls through to
+        # the Parquet scan
+        bloom = BloomFilter.load(self._bloom_path(partition_path))
+        if bloom is not None and content_hash not in bloom:
+            return False
+
+        # Filtered single-column scan: row-group statistics let Arrow
+        # skip groups whose min/max exclude the hash, so nothing is
+        # decoded or validated just to answer a membership test. Batch
+        # callers should still prefer load_hash_index.
         try:
-            articles = self.read_raw_news(date=date)
-            return any(article.hash_content == content_hash for article in articles)
+            matches = self._open_dataset(partition_path).to_table(
+                columns=["hash_content"],
+                filter=ds.field("hash_content") == content_hash
+            )
+            return matches.num_rows > 0
         except Exception:
             return False
 
+    def load_hash_index(self, date: Optional[datetime] = None) -> frozenset:
+        """Load all stored content hashes for a date as a frozenset.
+
+        Loading the index once per batch turns per-article duplicate checks
+        into O(1) membership tests instead of re-reading the partition.
+        Only the hash_content column is read from the Parquet files.
+
+        Args:
+            date: Date partition to index (default: today)
+
+        Returns:
+            Frozenset of content hashes (empty if no data)
+        """
+        try:
+            hashes = set(self._read_column("hash_content", date))
+        except Exception as e:
+            logger.error("Error reading hash index: %s", e)
+            return frozenset()
+
+        hashes.discard("")
+        return frozenset(hashes)
+
+    def load_simhash_index(
+        self,
+        date: Optional[datetime] = None
+    ) -> Dict[int, List[tuple[int, str]]]:
+        """Load stored title SimHashes bucketed by their top-16-bit band.
+
+        Candidate lookup for a new title then only scans its own bucket
+        instead of every stored title.
+
+        Args:
+            date: Date partition to index (default: today)
+
+        Returns:
+            Dict mapping band -> list of (simhash, title) pairs
+        """
+        index: Dict[int, List[tuple[int, str]]] = {}
+
+        partition_path = self._get_partition_path("news", date)
+        if not any(partition_path.glob("*.parquet")):
+            return index
+
+        # Projected two-column read: building the index never touches
+        # the content column or constructs RawNews models
+        try:
+            table = self._open_dataset(partition_path).to_table(
+                columns=["title_simhash", "title"]
+            )
+        except Exception as e:
+            logger.error("Error loading simhash index: %s", e)
+            return index
+
+        simhashes = table.column("title_simhash").to_pylist()
+        titles = table.column("title").to_pylist()
+        for simhash, title in zip(simhashes, titles):
+            if not simhash:
+                continue
+            index.setdefault(simhash >> 48, []).append((simhash, title))
+
+        return index
+
     def find_similar_titles(
         self,
         title: str,
@@ -334,19 +631,143 @@ class ParquetStorage:
         Returns:
             List of similar titles
         """
-        from src.utils.hash_utils import calculate_similarity
+        from src.utils.hash_utils import normalize_text, similarity_normalized
 
         try:
-            articles = self.read_raw_news(date=date)
+            # Only the title column is read; content never leaves disk
+            titles = self._read_column("title", date)
             similar = []
 
-            for article in articles:
-                similarity = calculate_similarity(title, article.title)
+            # Cheap token-overlap prefilter: titles whose Jaccard overlap
+            # is far below the threshold cannot reach it on the full
+            # ratio either, so most candidates skip the O(n*m) match.
+            # Each title is normalized exactly once and the normalized
+            # form feeds both the prefilter and the full ratio.
+            norm_query = normalize_text(title)
+            query_tokens = frozenset(norm_query.split())
+            cutoff = threshold * 0.5
+
+            for stored_title in titles:
+                norm_candidate = normalize_text(stored_title)
+                candidate_tokens = frozenset(norm_candidate.split())
+                if query_tokens and candidate_tokens:
+                    intersection = len(query_tokens & candidate_tokens)
+                    union = (
+                        len(query_tokens) + len(candidate_tokens) - intersection
+                    )
+                    if intersection / union < cutoff:
+                        continue
+
+                similarity = similarity_normalized(norm_query, norm_candidate)
                 if similarity >= threshold:
-                    similar.append(article.title)
+                    similar.append(stored_title)
 
             return similar
 
         except Exception as e:
-            logger.error(f"Error finding similar titles: {e}")
+            logger.error("Error finding similar titles: %s", e)
             return []
+
+
+# Arrow schema for processed-news rows (mirrors ProcessedNewsRow fields)
+PROCESSED_NEWS_SCHEMA = pa.schema([
+    ("article_id", pa.string()),
+    ("processing_stage", pa.string()),
+    ("chain_step", pa.int64()),
+    ("input_tokens", pa.int64()),
+    ("output_tokens", pa.int64()),
+    ("processing_time_ms", pa.int64()),
+    ("processed_at", pa.timestamp("us")),
+    ("summary", pa.string()),
+    ("summary_cot", pa.string()),
+    ("topics", pa.string()),
+    ("topics_cot", pa.string()),
+    ("topics_confidence", pa.float64()),
+    ("impact_direction", pa.string()),
+    ("impact_mechanisms", pa.string()),
+    ("impact_confidence", pa.float64()),
+    ("impact_time_horizon", pa.string()),
+    ("impact_cot", pa.string()),
+    ("ranking_score", pa.int64()),
+    ("ranking_category", pa.string()),
+    ("ranking_justification", pa.string()),
+    ("ranking_trader_action", pa.string()),
+    ("ranking_cot", pa.string()),
+    ("date_partition", pa.string()),
+])
+
+
+class ProcessedNewsStreamWriter:
+    """Streams processed articles to Parquet as they complete.
+
+    Instead of buffering a whole day's ProcessedNews in memory and
+    writing one DataFrame at the end, rows are appended to an open
+    ParquetWriter in small row groups. A crash mid-run leaves a valid
+    partial file whose article_ids can seed resume logic, and peak
+    memory stays bounded by flush_every rows.
+    """
+
+    def __init__(
+        self,
+        base_dir: Path,
+        date: Optional[datetime] = None,
+        flush_every: int = 8
+    ):
+        """Initialize the stream writer.
+
+        Args:
+            base_dir: Storage base directory (same as ParquetStorage)
+            date: Date for partitioning (default: today)
+            flush_every: Rows buffered before a row group is written
+        """
+        processed_dir = Path(base_dir).parent / "processed" / "news"
+        partition_path = processed_dir / get_date_partition(date)
+        partition_path.mkdir(parents=True, exist_ok=True)
+
+        timestamp = (date or datetime.now()).strftime("%Y%m%d_%H%M%S")
+        self.filepath = partition_path / f"processed_news_{timestamp}.parquet"
+        self.flush_every = flush_every
+        self.count = 0
+        self._buffer: List[Dict[str, Any]] = []
+        self._writer: Optional[pq.ParquetWriter] = None
+
+    def append(self, article: ProcessedNews) -> None:
+        """Append one processed article; flushes a row group when full.
+
+        Args:
+            article: Processed article to persist
+        """
+        self._buffer.append(row_to_record(processed_news_to_row(article)))
+        self.count += 1
+        if len(self._buffer) >= self.flush_every:
+            self._flush()
+
+    def _flush(self) -> None:
+        """Write buffered rows as one row group; opens the file lazily."""
+        if not self._buffer:
+            return
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(
+                self.filepath,
+                PROCESSED_NEWS_SCHEMA,
+                compression=PARQUET_COMPRESSION,
+                compression_level=PARQUET_COMPRESSION_LEVEL,
+                use_dictionary=True
+            )
+        batch = pa.RecordBatch.from_pylist(self._buffer, schema=PROCESSED_NEWS_SCHEMA)
+        self._writer.write_batch(batch)
+        self._buffer.clear()
+
+    def close(self) -> None:
+        """Flush remaining rows and close the file."""
+        self._flush()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            logger.info("Wrote %d processed articles to %s", self.count, self.filepath)
+
+    def __enter__(self) -> "ProcessedNewsStreamWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -0,0 +1,87 @@
+"""On-disk cache for LLM responses keyed by prompt hash.
+
+Re-running an analysis for a past date (debugging, backfills) re-pays
+the full LLM cost for a prompt that is byte-identical to a previous
+run. Deterministic prompts can instead be answered from a small
+file-per-key JSON cache: the key hashes the prompt together with the
+model, token budget, and a template version, so changing any of them
+invalidates cleanly.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bump when a prompt template changes meaning so stale entries miss
+PROMPT_VERSION = 1
+
+
+class ResponseCache:
+    """File-backed cache mapping prompt hashes to parsed LLM responses."""
+
+    def __init__(self, cache_dir: Path):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding one JSON file per entry
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(prompt: str, model: str, max_tokens: int) -> str:
+        """Build a cache key covering everything that shapes the response.
+
+        Args:
+            prompt: Full prompt text (static prefix + dynamic payload)
+            model: Model the call is routed to
+            max_tokens: Output token budget
+
+        Returns:
+            Hex digest usable as a filename
+        """
+        payload = f"{PROMPT_VERSION}|{model}|{max_tokens}|{prompt}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path_for(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached entry.
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            Cached entry dict, or None on miss or unreadable entry
+        """
+        path = self._path_for(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning("Dropping unreadable cache entry %s: %s", path.name, e)
+            return None
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store an entry atomically (write to temp file, then rename).
+
+        Args:
+            key: Key from make_key
+            value: JSON-serializable entry to store
+        """
+        path = self._path_for(key)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(value, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Failed to write cache entry %s: %s", path.name, e)
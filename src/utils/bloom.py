@@ -0,0 +1,71 @@
+"""Minimal Bloom filter for fast negative membership checks."""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Optional
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings, persistable as raw bytes.
+
+    A membership test is k hash probes into a bit array: a miss proves
+    the item was never added, a hit means "probably present" and the
+    caller must confirm against the authoritative store. Sized at
+    128 Kbit with 9 probes, the false-positive rate stays under 0.1%
+    up to ~10k items — orders of magnitude above a day's scrape.
+    """
+
+    SIZE_BITS = 1 << 17
+    NUM_HASHES = 9
+
+    def __init__(self, bits: Optional[bytearray] = None):
+        """Initialize the filter.
+
+        Args:
+            bits: Existing bit array (default: empty filter)
+        """
+        self._bits = bits if bits is not None else bytearray(self.SIZE_BITS // 8)
+
+    def _probes(self, item: str):
+        """Yield the k bit positions for an item.
+
+        One 16-byte BLAKE2b digest is sliced into independent probe
+        indexes instead of hashing k times.
+        """
+        digest = hashlib.blake2b(
+            item.encode("utf-8"), digest_size=16, usedforsecurity=False
+        ).digest()
+        base = int.from_bytes(digest[:8], "big")
+        step = int.from_bytes(digest[8:], "big") | 1
+        for i in range(self.NUM_HASHES):
+            yield (base + i * step) % self.SIZE_BITS
+
+    def add(self, item: str) -> None:
+        """Add an item to the filter."""
+        for position in self._probes(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        """Check membership (False is definitive, True is probabilistic)."""
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._probes(item)
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["BloomFilter"]:
+        """Load a filter from disk, or None if missing or malformed."""
+        try:
+            bits = bytearray(path.read_bytes())
+        except OSError:
+            return None
+        if len(bits) != cls.SIZE_BITS // 8:
+            return None
+        return cls(bits)
+
+    def save(self, path: Path) -> None:
+        """Persist the filter atomically (temp file, then rename)."""
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(bytes(self._bits))
+        os.replace(tmp_path, path)
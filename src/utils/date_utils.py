@@ -1,8 +1,17 @@
 """Date utilities for the pipeline."""
 
+import re
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 
+# URL date patterns, compiled once at import so per-article parsing is a
+# single C-level search over a short string
+_URL_DATE_PATTERNS = (
+    re.compile(r'/(\d{4})/(\d{2})/(\d{2})/'),
+    re.compile(r'/(\d{4})-(\d{2})-(\d{2})-'),
+)
+
 
 def get_today_str(fmt: str = "%Y-%m-%d") -> str:
     """Get today's date as a formatted string.
@@ -16,9 +25,19 @@ def get_today_str(fmt: str = "%Y-%m-%d") -> str:
     return datetime.now().strftime(fmt)
 
 
+@lru_cache(maxsize=64)
+def _fmt_partition(year: int, month: int, day: int) -> str:
+    """Render one partition string per calendar day (cached)."""
+    return f"date={year:04d}-{month:02d}-{day:02d}"
+
+
 def get_date_partition(date: Optional[datetime] = None) -> str:
     """Get Hive-style date partition string.
 
+    A run renders the same day over and over (every partition path and
+    filename), so the string is formatted once per calendar day and
+    served from cache after that.
+
     Args:
         date: Date to partition (default: today)
 
@@ -27,7 +46,7 @@ def get_date_partition(date: Optional[datetime] = None) -> str:
     """
     if date is None:
         date = datetime.now()
-    return f"date={date.strftime('%Y-%m-%d')}"
+    return _fmt_partition(date.year, date.month, date.day)
 
 
 def parse_date_from_url(url: str) -> Optional[datetime]:
@@ -41,17 +60,14 @@ def parse_date_from_url(url: str) -> Optional[datetime]:
     Returns:
         Parsed datetime or None if not found
     """
-    import re
-
-    pattern = r'/(\d{4})/(\d{2})/(\d{2})/'
-    match = re.search(pattern, url)
-
-    if match:
-        year, month, day = match.groups()
-        try:
-            return datetime(int(year), int(month), int(day))
-        except ValueError:
-            return None
+    for pattern in _URL_DATE_PATTERNS:
+        match = pattern.search(url)
+        if match:
+            year, month, day = match.groups()
+            try:
+                return datetime(int(year), int(month), int(day))
+            except ValueError:
+                return None
 
     return None
 
@@ -1,6 +1,7 @@
 """Retry utilities with exponential backoff."""
 
 import time
+import random
 import logging
 from typing import Callable, TypeVar, Any
 from functools import wraps
@@ -15,7 +16,8 @@ def retry_with_backoff(
     base_delay: float = 1.0,
     max_delay: float = 60.0,
     exponential_base: float = 2.0,
-    exceptions: tuple = (Exception,)
+    exceptions: tuple = (Exception,),
+    jitter: bool = True
 ):
     """Decorator for retrying a function with exponential backoff.
 
@@ -25,6 +27,8 @@ def retry_with_backoff(
         max_delay: Maximum delay in seconds
         exponential_base: Base for exponential backoff
         exceptions: Tuple of exceptions to catch and retry
+        jitter: Randomize each delay by 0.5-1.5x so concurrent callers
+            hitting the same rate limit don't retry in lockstep
 
     Returns:
         Decorated function
@@ -47,8 +51,10 @@ def retry_with_backoff(
                         )
                         raise
 
-                    # Calculate delay with exponential backoff
+                    # Calculate delay with exponential backoff (+ jitter)
                     delay = min(base_delay * (exponential_base ** attempt), max_delay)
+                    if jitter:
+                        delay = min(delay * random.uniform(0.5, 1.5), max_delay)
 
                     logger.warning(
                         f"Function {func.__name__} failed on attempt {attempt + 1}/{max_retries + 1}. "
@@ -70,7 +76,8 @@ def retry_async_with_backoff(
     base_delay: float = 1.0,
     max_delay: float = 60.0,
     exponential_base: float = 2.0,
-    exceptions: tuple = (Exception,)
+    exceptions: tuple = (Exception,),
+    jitter: bool = True
 ):
     """Async decorator for retrying a function with exponential backoff.
 
@@ -80,6 +87,8 @@ def retry_async_with_backoff(
         max_delay: Maximum delay in seconds
         exponential_base: Base for exponential backoff
         exceptions: Tuple of exceptions to catch and retry
+        jitter: Randomize each delay by 0.5-1.5x so concurrent callers
+            hitting the same rate limit don't retry in lockstep
 
     Returns:
         Decorated async function
@@ -104,8 +113,10 @@ def retry_async_with_backoff(
                         )
                         raise
 
-                    # Calculate delay with exponential backoff
+                    # Calculate delay with exponential backoff (+ jitter)
                     delay = min(base_delay * (exponential_base ** attempt), max_delay)
+                    if jitter:
+                        delay = min(delay * random.uniform(0.5, 1.5), max_delay)
 
                     logger.warning(
                         f"Async function {func.__name__} failed on attempt {attempt + 1}/{max_retries + 1}. "